@@ -0,0 +1,103 @@
+# Adaptive.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from Warm_Start import converged_unknowns, resample_unknowns
+
+
+# ----------------------------------------------------------------------
+#   Mission Quantities Used for the Error Estimate
+# ----------------------------------------------------------------------
+
+def mission_metrics(results):
+    segments = list(results.segments.values())
+    first    = segments[0].conditions
+    last     = segments[-1].conditions
+
+    metrics = np.zeros(3)
+    metrics[0] = last.frames.inertial.position_vector[-1, 0]                        # range
+    metrics[1] = first.weights.total_mass[0, 0] - last.weights.total_mass[-1, 0]    # fuel
+    metrics[2] = max(np.max(segment.conditions.propulsion.throttle[:, 0]) for segment in segments)
+
+    return metrics
+
+
+def relative_error(coarse, fine):
+    # range and fuel relative, throttle absolute (already of order one)
+    scale = np.array([max(abs(fine[0]), 1.), max(abs(fine[1]), 1e-6), 1.])
+
+    return np.max(np.abs(fine - coarse) / scale)
+
+
+def set_control_points(mission, number_of_points):
+    for segment in mission.segments.values():
+        segment.state.numerics.number_control_points = number_of_points
+        segment.state.unknowns = resample_unknowns(segment.state.unknowns, number_of_points)
+
+
+# ----------------------------------------------------------------------
+#   Adaptive Discretization
+# ----------------------------------------------------------------------
+
+class Adaptive_Discretization(object):
+
+    def __init__(self, coarse=4, fine=32, tolerance=1e-3, step_tolerance=1e-2, bounds=None):
+        self.coarse         = coarse
+        self.fine           = fine
+        self.tolerance      = tolerance
+        self.step_tolerance = step_tolerance  # optimizer step, as a fraction of the design space, that counts as converging
+        self.bounds         = bounds          # (lower, upper) scaled input bounds the steps are measured against
+        self.hint           = 1.              # 0 far from convergence (stay coarse) ... 1 converging (full accuracy)
+        self.locked_points  = None            # set for the points of one gradient, which must share the base point's grid
+        self.number_of_points = coarse
+        self.refinements    = 0
+        self._last_iterate  = None
+
+    def evaluate(self, mission):
+        if self.locked_points is not None:
+            self.number_of_points = self.locked_points
+            set_control_points(mission, self.locked_points)
+            return mission.evaluate()
+
+        number_of_points = self.coarse
+        set_control_points(mission, number_of_points)
+        results = mission.evaluate()
+
+        tolerance = self.tolerance / self.hint if self.hint > 0. else np.inf
+        metrics   = mission_metrics(results)
+
+        while number_of_points < self.fine and np.isfinite(tolerance):
+            # the previous grid's converged unknowns seed the refined solve
+            for tag, unknowns in converged_unknowns(results).items():
+                mission.segments[tag].state.unknowns = unknowns
+
+            number_of_points = min(2 * number_of_points, self.fine)
+            set_control_points(mission, number_of_points)
+            results = mission.evaluate()
+            self.refinements += 1
+
+            refined = mission_metrics(results)
+            error   = relative_error(metrics, refined)
+            metrics = refined
+            if error < tolerance:
+                break
+
+        self.number_of_points = number_of_points
+
+        return results
+
+    def update_hint(self, x):
+        # scipy callback: large optimizer steps mean we are still far from the optimum
+        x = np.array(x, dtype=float)
+        if self._last_iterate is not None:
+            span      = 1. if self.bounds is None else np.array(self.bounds[1]) - np.array(self.bounds[0])
+            step      = np.linalg.norm((x - self._last_iterate) / span)
+            self.hint = float(np.clip(self.step_tolerance / max(step, 1e-300), 0., 1.))
+        self._last_iterate = x
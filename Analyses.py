@@ -15,6 +15,10 @@ from SUAVE.Core import Units
 # from supporting.empty_saga import empty
 from SUAVE.Methods.Weights.Correlations.General_Aviation import empty
 # from supporting.stability_saga import Fidelity_Zero
+# Polar (scipy.interpolate) is imported when use_polar_tables is set
+
+# answer the mission's lift/drag queries from CL/CD tables cached per airframe geometry
+use_polar_tables = False
 
 
 # ----------------------------------------------------------------------
@@ -24,27 +28,120 @@ from SUAVE.Methods.Weights.Correlations.General_Aviation import empty
 def setup(configs):
     analyses = SUAVE.Analyses.Analysis.Container()
 
-    # build a base analysis for each config
+    # build a base analysis for each config, on first use only
     for tag, config in configs.items():
-        analysis = base(config)
-        analyses[tag] = analysis
+        analyses[tag] = Lazy_Analysis(analyses, tag, config, adjustments.get(tag))
+
+    return analyses
 
-    # adjust analyses for configs
 
+# ----------------------------------------------------------------------
+#   Adjust Analyses for Configs
+# ----------------------------------------------------------------------
+
+def adjust_takeoff(analysis):
     # takeoff_analysis
-    analyses.takeoff.aerodynamics.settings.drag_coefficient_increment = 0.0000
+    analysis.aerodynamics.settings.drag_coefficient_increment = 0.0000
 
+
+def adjust_landing(analysis):
     # landing analysis
-    aerodynamics = analyses.landing.aerodynamics
+    aerodynamics = analysis.aerodynamics
 
-    return analyses
+
+adjustments = {
+    'takeoff': adjust_takeoff,
+    'landing': adjust_landing,
+}
+
+
+# ----------------------------------------------------------------------
+#   Lazy Analysis
+# ----------------------------------------------------------------------
+
+class Lazy_Analysis(object):
+    # stands in for a config's analysis stack until something uses it. Asking only for the weights
+    # builds just the weights analysis, anything else builds (and, if requested, finalizes) the full stack.
+
+    def __init__(self, container, tag, vehicle, adjust=None):
+        self._container          = container
+        self._tag                = tag
+        self._vehicle            = vehicle
+        self._adjust             = adjust
+        self._weights            = None
+        self._analysis           = None   # the built stack, callers holding the placeholder keep using it
+        self._finalize_requested = False
+        self.touched             = set()
+
+    def materialize(self):
+        if self._analysis is not None:
+            return self._analysis
+
+        analysis = base(self._vehicle, self._weights)
+        if self._adjust is not None:
+            self._adjust(analysis)
+        if self._finalize_requested:
+            analysis.finalize()
+
+        # from here on the container holds the real analysis
+        self.touched.add('*')
+        self._container[self._tag] = analysis
+        self._analysis             = analysis
+
+        return analysis
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        if name == 'weights' and self._analysis is None:
+            if self._weights is None:
+                self._weights = weights_analysis(self._vehicle)
+            self.touched.add(name)
+            return self._weights
+
+        return getattr(self.materialize(), name)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def finalize(self):
+        if self._analysis is not None:
+            return self._analysis.finalize()
+
+        # deferred until the analysis is built
+        self._finalize_requested = True
+        if self._weights is not None:
+            self._weights.finalize()
+
+
+def materialize(analyses, tag):
+    analysis = analyses[tag]
+    if isinstance(analysis, Lazy_Analysis):
+        analysis = analysis.materialize()
+
+    return analysis
+
+
+def touched(analyses):
+    # { tag : what has been built } -> '*' full stack, 'weights' weights only, None untouched
+    report = {}
+    for tag, analysis in analyses.items():
+        if not isinstance(analysis, Lazy_Analysis):
+            report[tag] = '*'
+        elif analysis.touched:
+            report[tag] = ', '.join(sorted(analysis.touched))
+        else:
+            report[tag] = None
+
+    return report
 
 
 # ----------------------------------------------------------------------
 #   Define Base Analysis
 # ----------------------------------------------------------------------
 
-def base(vehicle):
+def base(vehicle, weights=None):
     # ------------------------------------------------------------------
     #   Initialize the Analyses
     # ------------------------------------------------------------------
@@ -58,15 +155,14 @@ def base(vehicle):
 
     # ------------------------------------------------------------------
     #  Weights
-    weights = SUAVE.Analyses.Weights.Weights_Transport()
-    # weights.settings.empty_weight_method = empty
-    weights.vehicle = vehicle
+    if weights is None:
+        weights = weights_analysis(vehicle)
     analyses.append(weights)
 
     # ------------------------------------------------------------------
     #  Aerodynamics Analysis
     # if not AVL_analysis:  # Run zero-fidelity method
-    aerodynamics = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    aerodynamics = aerodynamics_analysis()
     aerodynamics.geometry = vehicle
     # aerodynamics.process.compute.lift.inviscid_wings.training.angle_of_attack = np.array([[-5., 0.0, 5.0, 10.0, 75.]]).T * Units.deg
     # aerodynamics.process.compute.lift.inviscid_wings.training.Mach            = np.array([[0.0, 0.2, 0.5, 0.70, 0.80, 0.9, 1.3, 1.35, 1.5, 2.0]]).T
@@ -82,7 +178,8 @@ def base(vehicle):
 
     # # ------------------------------------------------------------------
     #  Stability Analysis
-    stability = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    # on the polar path too, a plain Fidelity_Zero would retrain its surrogate at every finalize
+    stability = aerodynamics_analysis()
     stability.geometry = vehicle
     analyses.append(stability)
 
@@ -111,3 +208,19 @@ def base(vehicle):
 
     # done!
     return analyses
+
+
+def aerodynamics_analysis():
+    if use_polar_tables:
+        from Polar import Polar_Aerodynamics
+        return Polar_Aerodynamics()
+
+    return SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+
+
+def weights_analysis(vehicle):
+    weights = SUAVE.Analyses.Weights.Weights_Transport()
+    # weights.settings.empty_weight_method = empty
+    weights.vehicle = vehicle
+
+    return weights
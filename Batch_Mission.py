@@ -0,0 +1,323 @@
+# Batch_Mission.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+
+import SUAVE
+import numpy as np
+from SUAVE.Core import Units, Data
+
+# The batched cruise is a reduced-order model, not SUAVE's segment solve: per design the aerodynamics
+# and the engine are sampled once at the cruise condition and fitted as a linear CL(alpha), a quadratic
+# CD(CL) and thrust / fuel flow linear in throttle, then the trim is solved on those fits.
+# full_solve_check() compares it against mission.evaluate() at one design.
+
+# sample points used to fit the cruise polar and the engine lines of every design
+polar_angles     = np.array([-2., 0., 2., 4., 6.]) * Units.deg
+engine_throttles = np.array([0.2, 0.4, 0.6, 0.8, 1.0])
+
+# summary fields that come from the cruise solve, nan for a design whose trim did not converge
+mission_fields = ['max_throttle', 'min_throttle', 'fuel_margin', 'max_zero_fuel_margin', 'mission_range',
+                  'total_range', 'nothing', 'clmax']
+
+
+class Cruise_Not_Converged(Exception):
+    pass
+
+
+# ----------------------------------------------------------------------
+#   Freestream State
+# ----------------------------------------------------------------------
+
+def freestream_state(analyses, altitude, air_speed, rows):
+    # a mission-like state with all rows at the same flight condition
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(rows)
+
+    ones       = np.ones((rows, 1))
+    atmo_data  = analyses.atmosphere.compute_values(altitude)
+    freestream = state.conditions.freestream
+
+    freestream.altitude          = altitude * ones
+    freestream.pressure          = atmo_data.pressure * ones
+    freestream.temperature       = atmo_data.temperature * ones
+    freestream.density           = atmo_data.density * ones
+    freestream.speed_of_sound    = atmo_data.speed_of_sound * ones
+    freestream.dynamic_viscosity = atmo_data.dynamic_viscosity * ones
+    freestream.velocity          = air_speed * ones
+    freestream.mach_number       = freestream.velocity / freestream.speed_of_sound
+    freestream.dynamic_pressure  = 0.5 * freestream.density * freestream.velocity ** 2
+    freestream.reynolds_number   = freestream.density * freestream.velocity / freestream.dynamic_viscosity
+    freestream.gravity           = 9.81 * ones
+
+    state.conditions.frames.inertial.velocity_vector[:, 0] = air_speed
+
+    return state
+
+
+# ----------------------------------------------------------------------
+#   Design Point Extraction
+# ----------------------------------------------------------------------
+
+def cruise_design_point(nexus, segment_tag='cruise'):
+    # needs the nexus sized, weighed and finalized for this design
+    segment  = nexus.missions.base.segments[segment_tag]
+    analyses = segment.analyses
+    vehicle  = analyses.aerodynamics.geometry
+    takeoff  = nexus.vehicle_configurations.takeoff
+
+    point = Data()
+    point.altitude        = segment.altitude
+    point.air_speed       = segment.air_speed
+    point.distance        = segment.distance
+    point.mass            = vehicle.mass_properties.takeoff
+    point.reference_area  = vehicle.reference_area
+    point.density         = analyses.atmosphere.compute_values(point.altitude).density[0, 0]
+
+    # non-mission summary fields, see Procedure.post_process
+    point.summary         = deepcopy(nexus.summary)
+    point.operating_empty = nexus.vehicle_configurations.base.mass_properties.operating_empty
+    point.max_payload     = nexus.vehicle_configurations.base.mass_properties.max_payload
+    point.max_zero_fuel   = takeoff.mass_properties.max_zero_fuel
+
+    # lift curve and drag polar at the cruise condition
+    state = freestream_state(analyses, point.altitude, point.air_speed, len(polar_angles))
+    state.conditions.aerodynamics.angle_of_attack[:, 0] = polar_angles
+    aerodynamics = analyses.aerodynamics(state)
+    CL = aerodynamics.lift.total[:, 0]
+    CD = aerodynamics.drag.total[:, 0]
+
+    point.lift_curve = np.polyfit(polar_angles, CL, 1)  # CL = a1 * alpha + a0
+    point.drag_polar = np.polyfit(CL, CD, 2)            # CD = b2 * CL^2 + b1 * CL + b0
+
+    # thrust and fuel flow lines against throttle
+    state = freestream_state(analyses, point.altitude, point.air_speed, len(engine_throttles))
+    state.conditions.propulsion.throttle[:, 0] = engine_throttles
+    propulsion = analyses.energy.evaluate_thrust(state)
+
+    point.thrust_curve = np.polyfit(engine_throttles, propulsion.thrust_force_vector[:, 0], 1)
+    point.fuel_curve   = np.polyfit(engine_throttles, propulsion.vehicle_mass_rate[:, 0], 1)
+
+    return point
+
+
+def stack_points(points):
+    batch = Data()
+    for key in ['altitude', 'air_speed', 'distance', 'mass', 'reference_area', 'density']:
+        batch[key] = np.array([float(point[key]) for point in points])[:, None]
+    for key in ['lift_curve', 'drag_polar', 'thrust_curve', 'fuel_curve']:
+        batch[key] = np.array([point[key] for point in points])
+
+    return batch
+
+
+# ----------------------------------------------------------------------
+#   Stacked Cruise Solve
+# ----------------------------------------------------------------------
+
+def solve_cruise(points, number_of_control_points=16, tolerance=1e-8, max_iterations=50, gravity=9.81):
+    # constant speed, constant altitude cruise of N designs as one (N x control points) system:
+    # unknowns throttle and angle of attack, residuals the wind-axis force balance
+    batch = stack_points(points)
+    N     = len(points)
+    n     = number_of_control_points
+
+    qS   = 0.5 * batch.density * batch.air_speed ** 2 * batch.reference_area
+    time = np.linspace(0., 1., n)[None, :] * (batch.distance / batch.air_speed)
+    dt   = np.diff(time, axis=1)
+
+    a1, a0     = batch.lift_curve[:, 0:1], batch.lift_curve[:, 1:2]
+    b2, b1, b0 = batch.drag_polar[:, 0:1], batch.drag_polar[:, 1:2], batch.drag_polar[:, 2:3]
+    t1, t0     = batch.thrust_curve[:, 0:1], batch.thrust_curve[:, 1:2]
+    f1, f0     = batch.fuel_curve[:, 0:1], batch.fuel_curve[:, 1:2]
+
+    mass     = batch.mass * np.ones((1, n))
+    alpha    = ((mass * gravity / qS) - a0) / a1
+    throttle = 0.5 * np.ones((N, n))
+
+    converged = np.zeros(N, dtype=bool)
+    for iteration in range(max_iterations):
+        W  = mass * gravity
+        CL = a1 * alpha + a0
+        CD = b2 * CL ** 2 + b1 * CL + b0
+        T  = t1 * throttle + t0
+
+        R_x = T * np.cos(alpha) - qS * CD
+        R_z = qS * CL + T * np.sin(alpha) - W
+
+        converged = np.max(np.abs(np.hstack([R_x, R_z])) / np.hstack([W, W]), axis=1) < tolerance
+        if np.all(converged):
+            break
+
+        # one newton step on every 2x2 trim system at once
+        J_11 = t1 * np.cos(alpha)
+        J_12 = -T * np.sin(alpha) - qS * (2. * b2 * CL + b1) * a1
+        J_21 = t1 * np.sin(alpha)
+        J_22 = qS * a1 + T * np.cos(alpha)
+        det  = J_11 * J_22 - J_12 * J_21
+
+        throttle = throttle - (J_22 * R_x - J_12 * R_z) / det
+        alpha    = alpha - (J_11 * R_z - J_21 * R_x) / det
+
+        # fuel burned along the segment, trapezoidal
+        mdot   = f1 * throttle + f0
+        burned = np.cumsum(0.5 * (mdot[:, 1:] + mdot[:, :-1]) * dt, axis=1)
+        mass   = batch.mass - np.hstack([np.zeros((N, 1)), burned])
+
+    results = Data()
+    results.time              = time
+    results.position          = batch.air_speed * time
+    results.altitude          = batch.altitude * np.ones((1, n))
+    results.throttle          = throttle
+    results.angle_of_attack   = alpha
+    results.lift_coefficient  = a1 * alpha + a0
+    results.drag_coefficient  = b2 * results.lift_coefficient ** 2 + b1 * results.lift_coefficient + b0
+    results.total_mass        = mass
+    results.vehicle_mass_rate = f1 * throttle + f0
+    results.converged         = converged
+    results.iterations        = iteration + 1
+
+    return results
+
+
+# ----------------------------------------------------------------------
+#   Results in Mission Layout
+# ----------------------------------------------------------------------
+
+def segment_results(results, index):
+    # the subset of segment conditions post_process and the plots read
+    n = results.time.shape[1]
+
+    conditions = Data()
+    conditions.frames = Data()
+    conditions.frames.inertial = Data()
+    conditions.frames.inertial.time = results.time[index][:, None]
+    position = np.zeros((n, 3))
+    position[:, 0] = results.position[index]
+    position[:, 2] = -results.altitude[index]
+    conditions.frames.inertial.position_vector = position
+
+    conditions.freestream = Data()
+    conditions.freestream.altitude = results.altitude[index][:, None]
+
+    conditions.propulsion = Data()
+    conditions.propulsion.throttle = results.throttle[index][:, None]
+
+    conditions.aerodynamics = Data()
+    conditions.aerodynamics.angle_of_attack  = results.angle_of_attack[index][:, None]
+    conditions.aerodynamics.lift_coefficient = results.lift_coefficient[index][:, None]
+    conditions.aerodynamics.drag_coefficient = results.drag_coefficient[index][:, None]
+
+    conditions.weights = Data()
+    conditions.weights.total_mass        = results.total_mass[index][:, None]
+    conditions.weights.vehicle_mass_rate = results.vehicle_mass_rate[index][:, None]
+
+    segment = Data()
+    segment.conditions = conditions
+
+    return segment
+
+
+def mission_results(results, index, segment_tag='cruise'):
+    mission = Data()
+    mission.segments = Data()
+    mission.segments[segment_tag] = segment_results(results, index)
+
+    return mission
+
+
+def batch_summaries(points, results):
+    # same fields as Procedure.post_process, vectorized over the designs
+    max_throttle  = np.maximum(np.max(results.throttle, axis=1), 0.)
+    min_throttle  = np.minimum(np.min(results.throttle, axis=1), 0.)
+    clmax         = np.maximum(np.max(results.lift_coefficient, axis=1), 0.)
+    landing_mass  = results.total_mass[:, -1]
+    mission_range = results.position[:, -1] / 1000.
+
+    summaries = []
+    for index, point in enumerate(points):
+        summary = deepcopy(point.summary)
+        summary.max_throttle         = max_throttle[index]
+        summary.min_throttle         = min_throttle[index]
+        summary.max_payload          = point.max_payload
+        summary.fuel_margin          = landing_mass[index] - point.operating_empty - point.max_payload
+        summary.max_zero_fuel_margin = (landing_mass[index] - point.max_zero_fuel) / point.max_zero_fuel
+        summary.mission_range        = mission_range[index]
+        summary.total_range          = mission_range[index]
+        summary.nothing              = 0.0
+        summary.clmax                = clmax[index]
+        summary.converged            = bool(results.converged[index])
+        if not summary.converged:
+            # a stalled newton solve is no valid design, the objective and constraints must not look like one
+            for field in mission_fields:
+                summary[field] = np.nan
+        summaries.append(summary)
+
+    return summaries
+
+
+# ----------------------------------------------------------------------
+#   Evaluate N Designs
+# ----------------------------------------------------------------------
+
+def prepare_design(nexus, x):
+    # size, weigh and finalize the design, then sample its cruise.
+    # Procedure imports this module (through Breguet), so it is imported here rather than at the top
+    import Procedure
+
+    nexus.unpack_inputs(x)
+    for tag, step in nexus.procedure.items():
+        if tag in ('missions', 'post_process'):
+            continue
+        if hasattr(step, 'evaluate'):
+            step.evaluate(nexus)
+        else:
+            step(nexus)
+
+    Procedure.setup_design_mission(nexus)
+
+    return cruise_design_point(nexus)
+
+
+def evaluate_designs(nexus, X, number_of_control_points=16):
+    # X holds one scaled input vector per row, as the optimizer would pass it.
+    # summaries of designs whose trim did not converge have converged = False and nan mission fields
+    points    = [prepare_design(nexus, x) for x in X]
+    results   = solve_cruise(points, number_of_control_points)
+    summaries = batch_summaries(points, results)
+
+    return summaries, results
+
+
+# ----------------------------------------------------------------------
+#   Consistency with the Full Segment Solve
+# ----------------------------------------------------------------------
+
+def full_solve_check(nexus, x, segment_tag='cruise', number_of_control_points=16):
+    # reduced-order cruise against mission.evaluate() at one design, both started from the same cruise mass
+    point = prepare_design(nexus, x)
+    full  = nexus.missions.base.evaluate().segments[segment_tag].conditions
+
+    point.mass = full.weights.total_mass[0, 0]
+    reduced    = solve_cruise([point], number_of_control_points)
+
+    full_fuel    = full.weights.total_mass[0, 0] - full.weights.total_mass[-1, 0]
+    reduced_fuel = reduced.total_mass[0, 0] - reduced.total_mass[0, -1]
+    full_CL      = np.mean(full.aerodynamics.lift_coefficient[:, 0])
+
+    check = Data()
+    check.converged              = bool(reduced.converged[0])
+    check.full_fuel              = full_fuel
+    check.reduced_fuel           = reduced_fuel
+    check.fuel_error             = abs(reduced_fuel - full_fuel) / full_fuel
+    check.throttle_error         = abs(np.mean(reduced.throttle) - np.mean(full.propulsion.throttle[:, 0]))
+    check.lift_coefficient_error = abs(np.mean(reduced.lift_coefficient) - full_CL) / abs(full_CL)
+
+    return check
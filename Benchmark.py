@@ -0,0 +1,278 @@
+# Benchmark.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+
+import numpy as np
+from SUAVE.Core import Units
+from SUAVE.Optimization import carpet_plot
+
+import Analyses
+import Engine_Deck
+import Optimize
+import Parallel
+import Polar
+import Profiling
+import Vehicle
+import Weight_Cache
+import engine
+
+# name -> function returning (state, run): building the state is not timed, run(state) is and may return sub-timings
+workloads = OrderedDict()
+
+
+def workload(name):
+    def register(function):
+        workloads[name] = function
+        return function
+
+    return register
+
+
+# ----------------------------------------------------------------------
+#   Cold Start
+# ----------------------------------------------------------------------
+
+def cold_start():
+    # module-level caches would turn every repeat after the first into a lookup,
+    # every workload's state builder calls this
+    engine.sized_engines.clear()
+    engine.engine_prototypes.clear()
+    Engine_Deck.engine_decks.clear()
+    Polar.polar_tables.clear()
+    Parallel._templates.clear()
+    Weight_Cache.weight_cache.clear()
+
+
+def fresh_problem():
+    cold_start()
+    problem = Optimize.setup()
+    problem.history       = None   # benchmarks do not belong in the optimization log
+    problem.results_store = None
+
+    return problem
+
+
+# ----------------------------------------------------------------------
+#   Workloads
+# ----------------------------------------------------------------------
+
+@workload('vehicle_setup')
+def vehicle_setup():
+    cold_start()
+    return None, lambda state: Vehicle.setup()
+
+
+@workload('engine_grid')
+def engine_grid():
+    def run(state):
+        for thrust in np.linspace(20., 60., 5) * Units.kN:
+            for bypass in np.linspace(4., 8., 5):
+                engine.engine_caluclations(10 * Units.km, bypass, 0.78, 2, thrust)
+
+    cold_start()
+    return None, run
+
+
+@workload('analyses_setup')
+def analyses_setup():
+    def run(configs):
+        analyses = Analyses.setup(configs)
+        for tag in configs.keys():
+            Analyses.materialize(analyses, tag).finalize()
+
+    cold_start()
+    return Vehicle.setup(), run
+
+
+@workload('procedure_steps')
+def procedure_steps():
+    problem = fresh_problem()
+    profile = Profiling.Procedure_Profile(use_cprofile=False)
+    profile.instrument(problem.procedure)
+
+    def run(problem):
+        problem.evaluate()
+        return OrderedDict(('procedure.' + name, step.wall_time) for name, step in profile.steps.items())
+
+    return problem, run
+
+
+@workload('objective')
+def objective():
+    return fresh_problem(), lambda problem: problem.objective()
+
+
+@workload('carpet_plot_5x5')
+def carpet_plot_5x5():
+    return fresh_problem(), lambda problem: carpet_plot(problem, 5, 0, 0)
+
+
+# ----------------------------------------------------------------------
+#   Import Time
+# ----------------------------------------------------------------------
+
+# entry points a batch job or a freshly spawned worker has to import before its first evaluation
+startup_modules = ['Optimize', 'Procedure']
+
+
+def import_times(module):
+    # -X importtime in a fresh interpreter, here everything would already be imported.
+    # { imported module : (self seconds, cumulative seconds) }
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                             cwd=os.path.dirname(os.path.abspath(__file__)), stdout=subprocess.DEVNULL,
+                             stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+    times = OrderedDict()
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(own) * 1e-6, int(cumulative) * 1e-6)
+
+    return times
+
+
+def import_report(modules=None, top=15):
+    lines = []
+    for module in (modules or startup_modules):
+        times = import_times(module)
+        lines.append('%s: %.3f s' % (module, times[module][1]))
+        slowest = sorted(times.items(), key=lambda item: -item[1][0])[:top]
+        for name, (own, cumulative) in slowest:
+            lines.append('    %-50s %8.3f s self %8.3f s cumulative' % (name, own, cumulative))
+
+    return '\n'.join(lines)
+
+
+def startup_workload(module):
+    def run(state):
+        return OrderedDict([('import.' + module, import_times(module)[module][1])])
+
+    return lambda: (None, run)
+
+
+for module in startup_modules:
+    workloads['import_' + module] = startup_workload(module)
+
+
+# ----------------------------------------------------------------------
+#   Measurement
+# ----------------------------------------------------------------------
+
+def machine_metadata():
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL,
+                                         cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return OrderedDict([('host', socket.gethostname()), ('platform', platform.platform()),
+                        ('processor', platform.processor()), ('cpu_count', multiprocessing.cpu_count()),
+                        ('python', sys.version.split()[0]), ('numpy', np.__version__),
+                        ('commit', commit), ('date', time.strftime('%Y-%m-%dT%H:%M:%S'))])
+
+
+def statistics(times):
+    times = np.array(times)
+    return OrderedDict([('min', float(np.min(times))), ('median', float(np.median(times))),
+                        ('mean', float(np.mean(times))), ('repeat', len(times))])
+
+
+def run(names=None, repeat=3):
+    timings = OrderedDict()
+    for name in (names or workloads.keys()):
+        times, sub_times = [], OrderedDict()
+        for _ in range(repeat):
+            state, function = workloads[name]()
+            start  = time.perf_counter()
+            result = function(state)
+            times.append(time.perf_counter() - start)
+            if isinstance(result, dict):
+                for sub_name, value in result.items():
+                    sub_times.setdefault(sub_name, []).append(value)
+
+        timings[name] = statistics(times)
+        for sub_name, values in sub_times.items():
+            timings[sub_name] = statistics(values)
+
+        print('%-40s %10.4f s (min of %d)' % (name, timings[name]['min'], repeat))
+
+    return OrderedDict([('machine', machine_metadata()), ('timings', timings)])
+
+
+def compare(results, baseline, threshold=0.10, thresholds=None, statistic='min'):
+    # [ name, baseline, current, ratio ] for every workload slower than its threshold allows
+    thresholds  = thresholds or {}
+    regressions = []
+    for name, current in results['timings'].items():
+        if name not in baseline['timings']:
+            continue
+        reference = baseline['timings'][name][statistic]
+        ratio     = current[statistic] / reference if reference > 0. else 1.
+        if ratio > 1. + thresholds.get(name, threshold):
+            regressions.append([name, reference, current[statistic], ratio])
+
+    return regressions
+
+
+# ----------------------------------------------------------------------
+#   Command Line
+# ----------------------------------------------------------------------
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description='Time the sizing, engine and mission hot paths.')
+    parser.add_argument('-w', '--workload', action='append', choices=list(workloads.keys()),
+                        help='workload to run (repeatable, default: all)')
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    parser.add_argument('-o', '--output', default='benchmark.json')
+    parser.add_argument('-b', '--baseline', help='results of an earlier run to compare against')
+    parser.add_argument('-t', '--threshold', type=float, default=0.10,
+                        help='allowed relative slow-down before a workload counts as a regression')
+    parser.add_argument('--workload-threshold', nargs=2, action='append', default=[], metavar=('NAME', 'THRESHOLD'),
+                        help='per-workload override of --threshold')
+    parser.add_argument('--import-report', action='store_true',
+                        help='only print where the startup modules spend their import time')
+    options = parser.parse_args(arguments)
+
+    if options.import_report:
+        print(import_report())
+        return 0
+
+    results = run(options.workload, options.repeat)
+    with open(options.output, 'w') as output:
+        json.dump(results, output, indent=2)
+
+    if options.baseline is None:
+        return 0
+
+    with open(options.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    thresholds  = dict((name, float(value)) for name, value in options.workload_threshold)
+    regressions = compare(results, baseline, options.threshold, thresholds)
+
+    for name, reference, current, ratio in regressions:
+        print('REGRESSION %-40s %10.4f s -> %10.4f s (x%.2f)' % (name, reference, current, ratio))
+    if not regressions:
+        print('No regressions against', options.baseline)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# Breguet.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from SUAVE.Core import Data
+
+from Batch_Mission import Cruise_Not_Converged, cruise_design_point, mission_results
+
+
+# ----------------------------------------------------------------------
+#   Trim at a Given Mass
+# ----------------------------------------------------------------------
+
+def trim(point, mass, gravity=9.81):
+    # level flight, thrust-induced lift neglected
+    qS = 0.5 * point.density * point.air_speed ** 2 * point.reference_area
+    CL = mass * gravity / qS
+    CD = np.polyval(point.drag_polar, CL)
+
+    drag     = qS * CD
+    throttle = (drag - point.thrust_curve[1]) / point.thrust_curve[0]
+    mdot     = np.polyval(point.fuel_curve, throttle)
+    alpha    = (CL - point.lift_curve[1]) / point.lift_curve[0]
+
+    return CL, CD, throttle, mdot, alpha
+
+
+# ----------------------------------------------------------------------
+#   Closed-Form Cruise
+# ----------------------------------------------------------------------
+
+def breguet_mission(nexus, segment_tag='cruise', number_of_trim_points=3, max_iterations=20, tolerance=1e-8,
+                    gravity=9.81):
+    # constant speed, constant altitude Breguet range equation, L/D and sfc taken at the mean cruise mass.
+    # uses the same fitted polar and engine lines as Batch_Mission
+    point = cruise_design_point(nexus, segment_tag)
+
+    V  = point.air_speed
+    m0 = point.mass
+    m1 = m0
+    for _ in range(max_iterations):
+        CL, CD, throttle, mdot, alpha = trim(point, 0.5 * (m0 + m1), gravity)
+        thrust = np.polyval(point.thrust_curve, throttle)
+        sfc    = mdot * gravity / thrust  # 1/s
+        m1, m1_last = m0 * np.exp(-point.distance * sfc / (V * CL / CD)), m1
+        if abs(m1 - m1_last) < tolerance * m0:
+            break
+    else:
+        raise Cruise_Not_Converged('Breguet cruise mass did not converge in %d iterations' % max_iterations)
+
+    if not (np.isfinite(m1) and 0. < m1 <= m0):
+        raise Cruise_Not_Converged('no trimmed Breguet cruise for this design (end mass %s)' % m1)
+
+    # a few trim points along the cruise
+    position = np.linspace(0., point.distance, number_of_trim_points)
+    mass     = m0 * np.exp(-position * sfc / (V * CL / CD))
+    CL, CD, throttle, mdot, alpha = trim(point, mass, gravity)
+
+    results = Data()
+    results.time              = (position / V)[None, :]
+    results.position          = position[None, :]
+    results.altitude          = point.altitude * np.ones((1, number_of_trim_points))
+    results.throttle          = throttle[None, :]
+    results.angle_of_attack   = alpha[None, :]
+    results.lift_coefficient  = CL[None, :]
+    results.drag_coefficient  = CD[None, :]
+    results.total_mass        = mass[None, :]
+    results.vehicle_mass_rate = mdot[None, :]
+
+    # same layout as the full solve so post_process does not care which one ran
+    return mission_results(results, 0, segment_tag)
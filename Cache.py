@@ -0,0 +1,175 @@
+# Cache.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import hashlib
+import time
+from collections import OrderedDict
+from copy import deepcopy
+
+import numpy as np
+from SUAVE.Optimization.Nexus import Nexus
+
+import Telemetry
+
+
+# ----------------------------------------------------------------------
+#   Bounded Least-Recently-Used Store
+# ----------------------------------------------------------------------
+
+class LRU_Cache(object):
+
+    def __init__(self, size=128):
+        self.size   = size
+        self.hits   = 0
+        self.misses = 0
+        self._store = OrderedDict()
+
+    def __len__(self):
+        return len(self._store)
+
+    def __contains__(self, key):
+        return key in self._store
+
+    def get(self, key):
+        if key not in self._store:
+            self.misses += 1
+            return None
+
+        self._store.move_to_end(key)
+        self.hits += 1
+
+        return self._store[key]
+
+    def put(self, key, value):
+        self._store[key] = value
+        self._store.move_to_end(key)
+
+        # evict the oldest entries once we are over the limit
+        while len(self._store) > self.size:
+            self._store.popitem(last=False)
+
+    def clear(self):
+        self._store.clear()
+        self.hits   = 0
+        self.misses = 0
+
+
+# ----------------------------------------------------------------------
+#   Scaled Input Vector
+# ----------------------------------------------------------------------
+
+def scaled_inputs(problem):
+    # [ tag, initial, lower, upper, scaling, units ] -> initial / scaling, as the optimizer sees it
+    inputs = problem.inputs
+
+    return np.array(inputs[:, 1], dtype=float) / np.array(inputs[:, 4], dtype=float)
+
+
+# ----------------------------------------------------------------------
+#   Fingerprint of a Data Tree
+# ----------------------------------------------------------------------
+
+def fingerprint(value, exclude=()):
+    # stable hash over the numeric/string leaves of nested Data, dicts, lists and arrays.
+    # keys starting with '_' and keys listed in exclude are skipped, other objects only count by type.
+    digest = hashlib.sha1()
+    _update_fingerprint(digest, value, set(exclude), set())
+
+    return digest.hexdigest()
+
+
+def _update_fingerprint(digest, value, exclude, active):
+    if isinstance(value, np.ndarray):
+        digest.update(('%s%s' % (value.dtype, value.shape)).encode())
+        if value.dtype == object:
+            for item in value.flat:
+                _update_fingerprint(digest, item, exclude, active)
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+
+    elif isinstance(value, (dict, list, tuple)):
+        if id(value) in active:
+            digest.update(b'<cycle>')
+            return
+        active.add(id(value))
+
+        digest.update(type(value).__name__.encode())
+        if isinstance(value, dict):
+            for key, item in sorted(value.items(), key=lambda kv: str(kv[0])):
+                if str(key).startswith('_') or key in exclude:
+                    continue
+                digest.update(str(key).encode())
+                _update_fingerprint(digest, item, exclude, active)
+        else:
+            for item in value:
+                _update_fingerprint(digest, item, exclude, active)
+
+        active.discard(id(value))
+
+    elif isinstance(value, (bool, np.bool_)):
+        digest.update(repr(bool(value)).encode())
+
+    elif value is None or isinstance(value, (str, complex)):
+        digest.update(repr(value).encode())
+
+    elif isinstance(value, (int, float, np.integer, np.floating)):
+        # 1000, 1000. and np.float64(1000.) are the same input
+        digest.update(repr(float(value)).encode())
+
+    else:
+        digest.update(type(value).__name__.encode())
+
+
+# ----------------------------------------------------------------------
+#   Memoized Nexus
+# ----------------------------------------------------------------------
+
+class Cached_Nexus(Nexus):
+
+    def __defaults__(self):
+        self.evaluation_cache = LRU_Cache(size=128)
+        self.history          = None
+        self._last_key        = None   # point nexus.summary currently belongs to
+
+    def cache_key(self):
+        return scaled_inputs(self.optimization_problem).tobytes(), self.fidelity_level
+
+    def evaluate(self, x=None):
+        self.unpack_inputs(x)
+
+        key = self.cache_key()
+        if key == self._last_key:
+            # objective, then constraints at the same x: Nexus.evaluate never re-solved these, so no cache hit
+            return
+
+        self._last_key = None
+        summary = self.evaluation_cache.get(key)
+
+        if summary is not None:
+            # repeated point: hand back the stored summary without running the procedure.
+            # nexus.results still holds the mission of the last point that was actually solved.
+            self.summary       = deepcopy(summary)
+            self.last_inputs   = deepcopy(self.optimization_problem.inputs)
+            self.last_fidelity = self.fidelity_level
+            self._last_key     = key
+            return
+
+        # diagnostics printed by the procedure steps are gathered into one telemetry record per solve,
+        # closed even when the solve raises (sweeps and DOE record the failure and carry on)
+        Telemetry.telemetry.begin(inputs=scaled_inputs(self.optimization_problem), fidelity=self.fidelity_level)
+        try:
+            start = time.time()
+            Nexus.evaluate(self, x)
+            self.evaluation_cache.put(key, deepcopy(self.summary))
+            self._last_key = key
+
+            if self.history is not None:
+                self.history.record(self, key, time.time() - start)
+        finally:
+            Telemetry.telemetry.end()
@@ -0,0 +1,86 @@
+# Configs.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from copy import copy
+
+from SUAVE.Components.Configs import Config
+
+
+def path_keys(path):
+    return path.split('.') if path else []
+
+
+def get_path(data, path):
+    for key in path_keys(path):
+        data = data[key]
+
+    return data
+
+
+# ----------------------------------------------------------------------
+#   Copy-on-Write Configuration
+# ----------------------------------------------------------------------
+
+class Overlay_Config(Config):
+    # shares every component with its base. Only the nodes on the way to an override (and the
+    # private subtrees) are copied, one level at a time. Writes inside a shared subtree reach every
+    # config at once; values held by the copied nodes themselves (top-level scalars such as
+    # reference_area, the main_wing copied for a flap override) follow the base on pull_base().
+    # Private subtrees are per config and never pulled.
+
+    def __init__(self, base, private=('mass_properties',)):
+        self._base      = base
+        self._owned     = set([''])   # paths of the nodes this config holds its own (shallow) copy of
+        self._private   = set(private)
+        self._overrides = {}
+        for key, value in base.items():
+            if not str(key).startswith('_'):
+                self[key] = value
+
+        for path in private:
+            self.own(path)
+
+    def own(self, path):
+        # path-copy down to the node at path, sharing all of its children
+        node   = self
+        prefix = []
+        for key in path_keys(path):
+            prefix.append(key)
+            name = '.'.join(prefix)
+            if name not in self._owned:
+                node[key] = copy(node[key])
+                self._owned.add(name)
+            node = node[key]
+
+        return node
+
+    def override(self, path, value):
+        keys = path_keys(path)
+        self.own('.'.join(keys[:-1]))[keys[-1]] = value
+        self._overrides[path] = value
+
+    def store_diff(self):
+        # the overrides are recorded as they are made, there is nothing to diff
+        pass
+
+    def pull_base(self):
+        # copy the base's values onto the copied nodes; shared subtrees are already current
+        for name in sorted(self._owned, key=lambda name: len(path_keys(name))):
+            if self.is_private(name):
+                continue
+            node, base_node = get_path(self, name), get_path(self._base, name)
+            for key, value in base_node.items():
+                child = name + '.' + key if name else key
+                if str(key).startswith('_') or key == 'tag' or child in self._owned or child in self._overrides:
+                    continue
+                node[key] = value
+
+    def is_private(self, path):
+        keys = path_keys(path)
+        return any(keys[:len(path_keys(private))] == path_keys(private) for private in self._private)
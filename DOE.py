@@ -0,0 +1,121 @@
+# DOE.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import csv
+import itertools
+import json
+import os
+import time
+
+import numpy as np
+from SUAVE.Core import Data
+
+import Parallel
+import Sampling
+from Incremental import get_path_values
+
+
+# ----------------------------------------------------------------------
+#   Designs over a Subset of the Inputs
+# ----------------------------------------------------------------------
+
+def design_points(problem, variables=None, method='lhs', number_of_points=100, levels=5, seed=None):
+    # full scaled input vectors: the chosen variables follow the design, the others stay at their initial value
+    inputs  = problem.optimization_problem.inputs
+    tags    = list(inputs[:, 0])
+    columns = [tags.index(tag) for tag in (variables or tags)]
+
+    if method == 'full_factorial':
+        u = Sampling.full_factorial(levels, len(columns))
+    else:
+        u = Sampling.unit_design(method, number_of_points, len(columns), seed)
+
+    X = np.tile(np.array(inputs[:, 1], dtype=float) / np.array(inputs[:, 4], dtype=float), (len(u), 1))
+    X[:, columns] = Sampling.to_scaled_inputs(u, inputs[columns])
+
+    return X
+
+
+# ----------------------------------------------------------------------
+#   Worker Side
+# ----------------------------------------------------------------------
+
+def alias_value(nexus, path):
+    # the first value an alias resolves to; '*' paths hold the same value in every config
+    path   = path[0] if isinstance(path, (list, tuple)) else path
+    values = get_path_values(nexus, path)
+    if not values:
+        return None
+
+    value = np.array(values[0])
+    if value.dtype == object:
+        return None
+    return float(value.reshape(-1)[0]) if value.size == 1 else json.dumps(value.tolist())
+
+
+def evaluate_doe_point(task):
+    index, x, settings = task
+    nexus = Parallel.worker_nexus(settings)
+
+    start = time.time()
+    try:
+        nexus.evaluate(x)
+        status = 'ok'
+    except Exception:
+        status = 'failed'
+
+    problem = nexus.optimization_problem
+    aliases = [alias_value(nexus, path) if status == 'ok' else None for _, path in problem.aliases]
+
+    # physical input values under the input tags, not the optimizer's scaled coordinates
+    values = np.array(x, dtype=float) * np.array(problem.inputs[:, 4], dtype=float)
+
+    return [index] + values.tolist() + aliases + [status, time.time() - start, os.getpid()]
+
+
+# ----------------------------------------------------------------------
+#   Driver
+# ----------------------------------------------------------------------
+
+def run_doe(problem, setup, filename, variables=None, method='lhs', number_of_points=100, levels=5, seed=None,
+            processes=None, batch_size=64):
+    X       = design_points(problem, variables, method, number_of_points, levels, seed)
+    inputs  = problem.optimization_problem.inputs
+    aliases = problem.optimization_problem.aliases
+    header  = ['index'] + list(inputs[:, 0]) + [alias[0] for alias in aliases] + ['status', 'wall_time', 'process']
+
+    pool   = Parallel.worker_pool(setup, processes)
+    counts = dict(ok=0, failed=0)
+    start  = time.time()
+
+    try:
+        with open(filename, 'w') as doe_file:
+            writer = csv.writer(doe_file)
+            writer.writerow(header)
+
+            # only one batch is in flight at a time, rows go to disk as they complete
+            settings = Parallel.worker_settings(problem)
+            tasks    = ((index, x, settings) for index, x in enumerate(X))
+            for batch in iter(lambda: list(itertools.islice(tasks, batch_size)), []):
+                for row in pool.imap_unordered(evaluate_doe_point, batch):
+                    writer.writerow(row)
+                    counts[row[-3]] += 1
+                doe_file.flush()
+                print("DOE: ", counts['ok'] + counts['failed'], "of", len(X), "points written to", filename)
+    finally:
+        pool.close()
+        pool.join()
+
+    outputs = Data()
+    outputs.filename         = filename
+    outputs.number_of_points = len(X)
+    outputs.status_counts    = counts
+    outputs.wall_time        = time.time() - start
+
+    return outputs
@@ -0,0 +1,132 @@
+# Engine_Deck.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+
+import numpy as np
+import SUAVE
+from scipy.interpolate import RegularGridInterpolator
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics, Conditions, State
+from SUAVE.Components.Energy.Networks.Turbofan import Turbofan
+from SUAVE.Core import Data, Units
+
+from Cache import LRU_Cache, fingerprint
+
+# decks by engine sizing key and grid, shared like the sized engines they come from
+engine_decks = LRU_Cache(size=16)
+
+# default grid, wide enough for the climb, cruise and descent segments of the missions
+deck_grid = Data()
+deck_grid.mach_number = np.linspace(0.1, 0.9, 17)
+deck_grid.altitude    = np.linspace(0., 13., 14) * Units.km
+deck_grid.throttle    = np.linspace(0.1, 1.0, 10)
+
+
+# ----------------------------------------------------------------------
+#   Deck Generation
+# ----------------------------------------------------------------------
+
+def cycle_conditions(mach_number, altitude, throttle):
+    # the same freestream the sizing sees, one row per deck point
+    rows       = len(mach_number)
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    freestream = atmosphere.compute_values(altitude[:, None])
+
+    conditions = Aerodynamics()
+    conditions.expand_rows(rows)
+    conditions.freestream.altitude          = altitude[:, None]
+    conditions.freestream.pressure          = freestream.pressure
+    conditions.freestream.temperature       = freestream.temperature
+    conditions.freestream.density           = freestream.density
+    conditions.freestream.speed_of_sound    = freestream.speed_of_sound
+    conditions.freestream.dynamic_viscosity = freestream.dynamic_viscosity
+    conditions.freestream.mach_number       = mach_number[:, None]
+    conditions.freestream.velocity          = mach_number[:, None] * freestream.speed_of_sound
+    conditions.freestream.gravity           = 9.81 * np.ones((rows, 1))
+    if 'propulsion' not in conditions:
+        conditions.propulsion = Conditions()
+    conditions.propulsion.throttle = throttle[:, None]
+
+    state = State()
+    state.conditions = conditions
+
+    return state
+
+
+class Engine_Deck(object):
+
+    def __init__(self, turbofan, grid=None):
+        grid = grid or deck_grid
+        self.axes = (np.array(grid.mach_number, dtype=float), np.array(grid.altitude, dtype=float),
+                     np.array(grid.throttle, dtype=float))
+        shape = tuple(len(axis) for axis in self.axes)
+
+        # the whole grid goes through the cycle as one vectorized evaluation
+        M, H, T = [value.reshape(-1) for value in np.meshgrid(*self.axes, indexing='ij')]
+        results = deepcopy(turbofan).evaluate_thrust(cycle_conditions(M, H, T))
+
+        self.thrust    = np.array(results.thrust_force_vector)[:, 0].reshape(shape)
+        self.fuel_flow = np.array(results.vehicle_mass_rate)[:, 0].reshape(shape)
+        self.sfc       = self.fuel_flow / np.maximum(self.thrust, 1e-12)   # kg/s/N
+
+        # linear extrapolation outside the grid (throttle is solved for and can leave [0, 1])
+        self._thrust    = RegularGridInterpolator(self.axes, self.thrust, bounds_error=False, fill_value=None)
+        self._fuel_flow = RegularGridInterpolator(self.axes, self.fuel_flow, bounds_error=False, fill_value=None)
+
+    def evaluate(self, mach_number, altitude, throttle):
+        # mach and altitude are held at the grid edges, only the throttle is extrapolated
+        points = np.column_stack([np.clip(np.ravel(mach_number), self.axes[0][0], self.axes[0][-1]),
+                                  np.clip(np.ravel(altitude), self.axes[1][0], self.axes[1][-1]),
+                                  np.ravel(throttle)])
+
+        return self._thrust(points), self._fuel_flow(points)
+
+
+def engine_deck(turbofan, key, grid=None):
+    grid     = grid or deck_grid
+    deck_key = (key, fingerprint(grid))
+    deck     = engine_decks.get(deck_key)
+    if deck is None:
+        deck = Engine_Deck(turbofan, grid)
+        engine_decks.put(deck_key, deck)
+
+    return deck
+
+
+# ----------------------------------------------------------------------
+#   Turbofan Evaluated from its Deck
+# ----------------------------------------------------------------------
+
+class Tabulated_Turbofan(Turbofan):
+
+    def evaluate_thrust(self, state):
+        conditions = state.conditions
+        freestream = conditions.freestream
+
+        thrust, fuel_flow = self._deck.evaluate(freestream.mach_number, freestream.altitude,
+                                                conditions.propulsion.throttle)
+
+        F       = np.zeros((len(thrust), 3))
+        F[:, 0] = thrust
+
+        results = Data()
+        results.thrust_force_vector = F
+        results.vehicle_mass_rate   = fuel_flow[:, None]
+
+        return results
+
+
+def tabulated_turbofan(turbofan, key, grid=None):
+    # same components and sized values as the cycle model, plus the deck ('_' keeps it out of fingerprints)
+    tabulated = Tabulated_Turbofan()
+    for tag, value in turbofan.items():
+        tabulated[tag] = value
+    tabulated._deck = engine_deck(turbofan, key, grid)
+
+    return tabulated
@@ -0,0 +1,141 @@
+# History.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import pickle
+import sqlite3
+import time
+
+import numpy as np
+import SUAVE.Optimization.helper_functions as help_fun
+
+from Cache import fingerprint
+from Process_Local import Process_Local
+
+schema = '''
+create table if not exists evaluations (
+    id          integer primary key autoincrement,
+    problem     text,
+    inputs      blob,
+    fidelity    integer,
+    objective   blob,
+    constraints blob,
+    summary     blob,
+    wall_time   real,
+    finished    real,
+    process     integer
+)'''
+
+
+# ----------------------------------------------------------------------
+#   Problem Signature and Output Values
+# ----------------------------------------------------------------------
+
+def problem_signature(problem):
+    # everything that gives a logged summary its meaning, except the current input values
+    inputs = np.array(problem.inputs)
+
+    return fingerprint([inputs[:, [0, 2, 3, 4]].tolist(), problem.objective, problem.constraints, problem.aliases])
+
+
+def output_values(nexus):
+    # unscaled objective and constraint values, as read through the aliases
+    problem     = nexus.optimization_problem
+    objective   = help_fun.get_values(nexus, problem.objective, problem.aliases)
+    constraints = help_fun.get_values(nexus, problem.constraints, problem.aliases)
+
+    return np.atleast_1d(np.array(objective, dtype=float)), np.atleast_1d(np.array(constraints, dtype=float))
+
+
+# ----------------------------------------------------------------------
+#   Append-Only Evaluation Log
+# ----------------------------------------------------------------------
+
+class History_Log(Process_Local):
+
+    def __init__(self, filename, problem, flush_every=25, flush_interval=30.):
+        self.filename       = filename
+        self.signature      = problem_signature(problem)
+        self.flush_every    = flush_every      # evaluations per transaction
+        self.flush_interval = flush_interval   # seconds, so slow runs still reach the disk regularly
+        self._check_process()
+
+    def _reset(self):
+        # rows pending in the parent are the parent's to write, and its connection is not shared
+        self._pending    = []
+        self._last_flush = time.time()
+        self._connection = None
+
+    def _connect(self):
+        # one connection per process, opened lazily
+        self._check_process()
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.filename, timeout=60.)
+            self._connection.execute(schema)
+            self._connection.commit()
+
+        return self._connection
+
+    def record(self, nexus, key, wall_time):
+        self._check_process()
+        inputs, fidelity       = key
+        objective, constraints = output_values(nexus)
+        self._pending.append((self.signature, inputs, int(fidelity),
+                              np.asarray(objective, dtype=float).tobytes(),
+                              np.asarray(constraints, dtype=float).tobytes(),
+                              pickle.dumps(nexus.summary, protocol=pickle.HIGHEST_PROTOCOL),
+                              float(wall_time), time.time(), os.getpid()))
+
+        if len(self._pending) >= self.flush_every or time.time() - self._last_flush > self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        self._check_process()
+        if self._pending:
+            connection = self._connect()
+            with connection:
+                connection.executemany('insert into evaluations (problem, inputs, fidelity, objective, constraints, '
+                                       'summary, wall_time, finished, process) values (?,?,?,?,?,?,?,?,?)',
+                                       self._pending)
+            self._pending = []
+        self._last_flush = time.time()
+
+    def records(self):
+        # logged evaluations of this problem, oldest first
+        self.flush()
+        if not os.path.exists(self.filename):
+            return
+
+        rows = self._connect().execute('select inputs, fidelity, objective, constraints, summary, wall_time '
+                                       'from evaluations where problem = ? order by id', (self.signature,))
+        for inputs, fidelity, objective, constraints, summary, wall_time in rows:
+            yield ((bytes(inputs), fidelity), pickle.loads(summary),
+                   np.frombuffer(objective), np.frombuffer(constraints), wall_time)
+
+    def resume(self, cache):
+        # replay the log into the evaluation cache: finished points are answered without a mission solve
+        records = list(self.records())
+        cache.size = max(cache.size, len(records))
+        for key, summary, _, _, _ in records:
+            cache.put(key, summary)
+
+        return len(records)
+
+
+# one log per file and problem in each process, so a second setup() (the worker pool's template) does not
+# keep a second set of pending rows for the same file
+history_logs = {}
+
+
+def history_log(filename, problem, **options):
+    key = (filename, problem_signature(problem))
+    if key not in history_logs:
+        history_logs[key] = History_Log(filename, problem, **options)
+
+    return history_logs[key]
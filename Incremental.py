@@ -0,0 +1,99 @@
+# Incremental.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from Cache import fingerprint
+
+
+# ----------------------------------------------------------------------
+#   Alias Path Lookup
+# ----------------------------------------------------------------------
+
+def get_path_values(data, path):
+    # same path syntax as the optimization aliases, '*' expands over every item of a container
+    values = [data]
+    for key in path.split('.'):
+        next_values = []
+        for value in values:
+            if key == '*':
+                next_values.extend(value.values())
+                continue
+            try:
+                next_values.append(value[key])
+            except (KeyError, AttributeError, TypeError):
+                pass
+        values = next_values
+
+    return values
+
+
+def set_path_value(data, path, value):
+    keys = path.split('.')
+    for key in keys[:-1]:
+        data = data[key]
+    data[keys[-1]] = value
+
+
+# ----------------------------------------------------------------------
+#   Procedure Step with Declared Dependencies
+# ----------------------------------------------------------------------
+
+class Step(object):
+
+    def __init__(self, function, reads=None, writes=()):
+        self.function         = function
+        self.reads            = reads   # None -> always evaluate
+        self.writes           = writes
+        self.evaluation_count = 0
+        self.skip_count       = 0
+        self._fingerprint     = None
+        self._summary         = {}
+
+    def read_fingerprint(self, nexus):
+        return fingerprint([get_path_values(nexus, path) for path in self.reads])
+
+    def evaluate(self, nexus):
+        if self.reads is not None and self._fingerprint is not None \
+                and self.read_fingerprint(nexus) == self._fingerprint:
+            self.skip_count += 1
+
+            # the evaluation cache may have swapped nexus.summary since this step last ran
+            for path, value in self._summary.items():
+                set_path_value(nexus, path, value)
+
+            return nexus
+
+        nexus = self.function(nexus)
+        self.evaluation_count += 1
+
+        if self.reads is not None:
+            # taken after the run so a step that rewrites its own inputs does not look dirty next time
+            self._fingerprint = self.read_fingerprint(nexus)
+            self._summary     = {}
+            for path in self.writes:
+                if path.startswith('summary.'):
+                    values = get_path_values(nexus, path)
+                    if values:
+                        self._summary[path] = values[0]
+
+        return nexus
+
+    __call__ = evaluate
+
+    def reset(self):
+        self._fingerprint = None
+        self._summary     = {}
+
+
+def reset(procedure):
+    # forget the stored fingerprints so every step runs on the next evaluation
+    for step in procedure.values():
+        if hasattr(step, 'reset'):  # a Step, or a wrapper around one
+            step.reset()
+        elif hasattr(step, 'values'):
+            reset(step)
@@ -12,6 +12,8 @@ import SUAVE
 from SUAVE.Core import Units
 import numpy as np
 
+from Analyses import materialize
+
 
 # ----------------------------------------------------------------------
 #   Define the Mission
@@ -126,7 +128,7 @@ def base(analyses):
     segment.tag                         = "cruise"
 
     # connect vehicle configuration
-    segment.analyses.extend(analyses.cruise)
+    segment.analyses.extend(materialize(analyses, 'cruise'))
 
     # segment attributes
     segment.atmosphere                  = atmosphere
@@ -191,7 +193,7 @@ def takeoff_mission_setup(analyses):
     # Climb Segment: Constant throttle, constant speed
     segment                     = Segments.Climb.Constant_Throttle_Constant_Speed(base_segment)
     segment.tag                 = "climb"
-    segment.analyses.extend(analyses.takeoff)
+    segment.analyses.extend(materialize(analyses, 'takeoff'))
     segment.altitude_start = 0. * Units.fts
     segment.altitude_end = 304.8 * Units.meter
     segment.air_speed = 85.4 * Units['m/s']
@@ -203,7 +205,7 @@ def takeoff_mission_setup(analyses):
     # Cutback Segment: Constant speed, constant segment angle
     segment = Segments.Climb.Constant_Speed_Constant_Angle_Noise(base_segment)
     segment.tag = "cutback"
-    segment.analyses.extend(analyses.takeoff)
+    segment.analyses.extend(materialize(analyses, 'takeoff'))
     segment.air_speed = 85.4 * Units['m/s']
     segment.climb_angle = 2.86 * Units.degrees
     # segment.state.numerics.discretization_method = SUAVE.Methods.Utilities.Chebyshev.linear_data
@@ -236,7 +238,7 @@ def landing_mission_setup(analyses):
     # ------------------------------------------------------------------
     segment = Segments.Descent.Constant_Speed_Constant_Angle_Noise(base_segment)
     segment.tag = "descent"
-    segment.analyses.extend(analyses.landing)
+    segment.analyses.extend(materialize(analyses, 'landing'))
 
     segment.air_speed = 67. * Units['m/s']
     segment.descent_angle = 3.0 * Units.degrees
@@ -0,0 +1,164 @@
+# Multi_Start.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import multiprocessing
+import time
+
+import numpy as np
+import scipy as sp
+import scipy.optimize
+from SUAVE.Core import Data
+
+import Parallel
+import Sampling
+
+
+class Known_Optimum(Exception):
+    pass
+
+
+# ----------------------------------------------------------------------
+#   Worker Side
+# ----------------------------------------------------------------------
+
+def nearest_optimum(u, known):
+    # index and unit-cube distance of the closest optimum another start already found
+    best, distance = None, np.inf
+    for ii, optimum in enumerate(list(known)):
+        d = np.linalg.norm(u - np.array(optimum['u']))
+        if d < distance:
+            best, distance = ii, d
+
+    return best, distance
+
+
+def run_start(task):
+    index, x0, known, merge_radius, iter, tolerance, settings = task
+    nexus  = Parallel.worker_nexus(settings)
+    inputs = nexus.optimization_problem.inputs
+    lower, upper = Sampling.scaled_bounds(inputs)
+
+    def callback(xk):
+        # no point polishing an optimum another start has already converged to
+        match, distance = nearest_optimum(Sampling.to_unit(xk, inputs), known)
+        if distance < merge_radius:
+            raise Known_Optimum(match, np.array(xk))
+
+    start  = time.time()
+    result = Data(index=index, x0=np.array(x0), merged_with=None)
+    try:
+        x, objective, iterations, mode, message = sp.optimize.fmin_slsqp(
+            nexus.objective, x0, f_eqcons=nexus.equality_constraint, f_ieqcons=nexus.inequality_constraint,
+            bounds=np.column_stack([lower, upper]), iter=iter, acc=tolerance, callback=callback,
+            full_output=True, iprint=0)
+        result.status     = 'converged' if mode == 0 else 'failed'
+        result.message    = message
+        result.iterations = iterations
+    except Known_Optimum as stop:
+        x = stop.args[1]
+        result.status      = 'merged'
+        result.message     = 'reached a known optimum'
+        result.iterations  = None
+        result.merged_with = stop.args[0]
+    except Exception as error:
+        x = np.array(x0)
+        result.status     = 'error'
+        result.message    = repr(error)
+        result.iterations = None
+
+    try:
+        result.objective = float(np.atleast_1d(nexus.objective(x))[0])
+        equality         = np.atleast_1d(nexus.equality_constraint(x))
+        inequality       = np.atleast_1d(nexus.inequality_constraint(x))
+        result.feasible  = bool(np.all(np.abs(equality) <= 1e-4) and np.all(inequality >= -1e-4))
+    except Exception:
+        result.objective, result.feasible = np.nan, False
+
+    result.x         = np.array(x)
+    result.u         = Sampling.to_unit(x, inputs)
+    result.wall_time = time.time() - start
+
+    if result.status == 'converged' and result.feasible:
+        known.append(dict(u=result.u.tolist(), objective=result.objective, index=index))
+
+    return result
+
+
+# ----------------------------------------------------------------------
+#   Driver
+# ----------------------------------------------------------------------
+
+def cluster_optima(results, merge_radius):
+    # distinct local optima among the feasible end points, each with the starts that led to it
+    optima = []
+    for result in sorted(results, key=lambda result: result.objective):
+        if not result.feasible or result.status in ['error', 'failed']:
+            continue
+        for optimum in optima:
+            if np.linalg.norm(result.u - optimum.u) < merge_radius:
+                optimum.starts.append(result.index)
+                break
+        else:
+            optima.append(Data(x=result.x, u=result.u, objective=result.objective, starts=[result.index]))
+
+    return optima
+
+
+def Multi_Start_Solve(problem, setup, number_of_starts=8, sampling='lhs', processes=None, seed=None, iter=200,
+                      tolerance=1e-6, merge_radius=1e-2, include_initial=True):
+    inputs = problem.optimization_problem.inputs
+
+    # starting points inside the bounds, the point in problem.inputs first
+    X0 = Sampling.to_scaled_inputs(Sampling.unit_design(sampling, number_of_starts, len(inputs), seed), inputs)
+    if include_initial:
+        X0[0] = np.array(inputs[:, 1], dtype=float) / np.array(inputs[:, 4], dtype=float)
+
+    manager = multiprocessing.Manager()
+    known   = manager.list()   # optima found so far, shared by all workers
+    pool    = Parallel.worker_pool(setup, processes)
+
+    results = []
+    try:
+        settings = Parallel.worker_settings(problem)
+        tasks    = [(ii, x0, known, merge_radius, iter, tolerance, settings) for ii, x0 in enumerate(X0)]
+        for result in pool.imap_unordered(run_start, tasks):
+            results.append(result)
+            print("Multi-start: start", result.index, result.status, ", objective ", result.objective,
+                  "(feasible)" if result.feasible else "(infeasible)", "-", len(results), "of", len(tasks), "done")
+    finally:
+        pool.close()
+        pool.join()
+        manager.shutdown()
+
+    results.sort(key=lambda result: result.index)
+    optima   = cluster_optima(results, merge_radius)
+    # a merged start stopped short of the optimum it found, so prefer the polished ones
+    feasible = [result for result in results if result.feasible and result.status == 'converged'] or \
+               [result for result in results if result.feasible]
+    best     = min(feasible, key=lambda result: result.objective) if feasible else None
+
+    outputs = Data()
+    outputs.x           = best.x if best is not None else None
+    outputs.objective   = best.objective if best is not None else None
+    outputs.feasible    = best is not None
+    outputs.starts      = results
+    outputs.optima      = optima
+
+    # how far apart the local optima are, in objective and in the unit design space
+    objectives = np.array([optimum.objective for optimum in optima])
+    outputs.spread = Data()
+    outputs.spread.number_of_optima = len(optima)
+    outputs.spread.objective_range  = float(np.ptp(objectives)) if len(optima) else np.nan
+    outputs.spread.objective_std    = float(np.std(objectives)) if len(optima) else np.nan
+    outputs.spread.max_distance     = float(max([np.linalg.norm(a.u - b.u) for a in optima for b in optima]
+                                                or [0.]))
+    outputs.spread.status_counts    = dict((status, sum(result.status == status for result in results))
+                                           for status in ['converged', 'merged', 'failed', 'error'])
+
+    return outputs
@@ -6,38 +6,67 @@
 #   Imports
 # ----------------------------------------------------------------------
 
-import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
-import matplotlib.pyplot as plt
 import numpy as np
 from SUAVE.Core import Units, Data
-from SUAVE.Optimization import Nexus, carpet_plot
-from SUAVE.Plots.Mission_Plots import *
+# matplotlib, the mission plots, carpet_plot, scipy_setup, the optimizer drivers and the optional
+# Adaptive/Profiling support are imported where used
 
 import Analyses
+import Cache
+import History
 import Missions
 import Procedure
+import Results_Store
+import Telemetry
 import Vehicle
+import Warm_Start
 
 # ----------------------------------------------------------------------
 #   Run the whole thing
 # ----------------------------------------------------------------------
 
 AVL_analysis = False  # AVL Analysis switch
+parallel_gradients = True  # evaluate the finite-difference points of each SLSQP gradient on a process pool
+adaptive_mission = False  # solve mission segments on a coarse grid first and refine only where needed
+resume_history = False  # answer evaluations already in the history log from it instead of solving them again
+profile_procedure = False  # time (and cProfile) every procedure step, gradient workers included, reported at the end of main()
+telemetry_verbosity = Telemetry.SUMMARY  # QUIET, SUMMARY or DETAIL; per-evaluation diagnostics go to telemetry_<pid>.jsonl
+keep_mission_results = True  # keep the full segment tree next to the flat mission columns (the plots need it)
 
 
 def main():
     print("SUAVE initialized...\n")
     problem = setup()  # "problem" is a nexus
+    # problem.fidelity_level = 0  # closed-form Breguet cruise, e.g. for early exploration sweeps
 
     # output = problem.objective()  # uncomment this line when using the default inputs
     # variable_sweep(problem)  # uncomment this to view some contours of the problem
-    output = scipy_setup.SciPy_Solve(problem, solver='SLSQP')  # uncomment this to optimize the values
+    # import DOE; DOE.run_doe(problem, setup, 'doe.csv', variables=['wing_area', 'AR'], method='sobol', number_of_points=256)
+    if parallel_gradients:
+        import Parallel
+        # the step size of each SLSQP iteration tells the adaptive grid how close we are to the optimum
+        callback = problem.adaptive_discretization.update_hint if adaptive_mission else None
+        output = Parallel.SciPy_Solve(problem, setup, callback=callback)  # one pre-built nexus per worker
+    else:
+        import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
+        output = scipy_setup.SciPy_Solve(problem, solver='SLSQP')  # uncomment this to optimize the values
+    # import Surrogate_Optimize; output = Surrogate_Optimize.Surrogate_Solve(problem, setup, max_evaluations=60)  # GP + expected improvement
+    # import Multi_Start; output = Multi_Start.Multi_Start_Solve(problem, setup, number_of_starts=8, sampling='sobol')  # SLSQP from 8 starts
     print(output)
 
+    cache = problem.evaluation_cache
+    print("Evaluation cache: ", cache.hits, "hits (mission solves saved), ", cache.misses, "misses")
+    print("Analyses built: ", Analyses.touched(problem.analyses))
+
+    if profile_procedure:
+        print(problem.procedure_profile.summary_table())
+        problem.procedure_profile.write_collapsed('procedure_profile.collapsed')
+
     # print('constraints=', problem.all_constraints())
 
 
     results = problem.results
+    # from SUAVE.Plots.Mission_Plots import plot_flight_conditions, plot_aerodynamic_forces, ...  # when re-enabled
     # Plot Flight Conditions
     # plot_flight_conditions(results)
     #
@@ -66,7 +95,8 @@ def main():
 # ----------------------------------------------------------------------
 
 def setup():
-    nexus = Nexus()
+    nexus = Cache.Cached_Nexus()
+    nexus.evaluation_cache.size = 256  # stored summaries, least recently used are dropped first
     problem = Data()
     nexus.optimization_problem = problem
 
@@ -150,7 +180,7 @@ def setup():
     # -------------------------------------------------------------------
     #  Vehicles
     # -------------------------------------------------------------------
-    nexus.vehicle_configurations = Vehicles.setup()
+    nexus.vehicle_configurations = Vehicle.setup()
 
     # -------------------------------------------------------------------
     #  Analyses
@@ -160,12 +190,37 @@ def setup():
     # -------------------------------------------------------------------
     #  Missions
     # -------------------------------------------------------------------
-    nexus.missions = Mission.setup(nexus.analyses)
+    nexus.missions = Missions.setup(nexus.analyses)
 
     # -------------------------------------------------------------------
     #  Procedure
     # -------------------------------------------------------------------
     nexus.procedure = Procedure.setup()
+    if profile_procedure:
+        import Profiling
+        nexus.procedure_profile = Profiling.Procedure_Profile()
+        nexus.procedure_profile.instrument(nexus.procedure)
+
+    # start each mission solve from the unknowns converged at the nearest recent design
+    nexus.warm_start = Warm_Start.Mission_Warm_Start(size=16)
+
+    if adaptive_mission:
+        import Adaptive
+        import Sampling
+        nexus.adaptive_discretization = Adaptive.Adaptive_Discretization(coarse=4, fine=32, tolerance=1e-3,
+                                                                         bounds=Sampling.scaled_bounds(problem.inputs))
+
+    Telemetry.configure(verbosity=telemetry_verbosity)
+
+    # every solved point goes to the log; workers append to the same file and resume from it as well
+    nexus.history = History.history_log('optimization_history.sqlite', problem)
+    if resume_history:
+        nexus.history.resume(nexus.evaluation_cache)
+
+    # flattened mission histories, one set of column files per process; keep_mission_results = False saves
+    # the memory of the segment trees when the plots are not needed
+    nexus.results_store = Results_Store.results_store('mission_results_{pid}',
+                                                      keep_mission_results=keep_mission_results)
 
     # -------------------------------------------------------------------
     #  Summary
@@ -176,8 +231,14 @@ def setup():
 
 
 def variable_sweep(problem, color_label, bar_label, xlabel, ylabel, title):
+    import matplotlib.pyplot as plt
+    import Sweep
+
     number_of_points = 5
-    outputs = carpet_plot(problem, number_of_points, 0, 0)  # run carpet plot, suppressing default plots
+    # from SUAVE.Optimization import carpet_plot
+    # outputs = carpet_plot(problem, number_of_points, 0, 0)  # run carpet plot, suppressing default plots
+    # grid points run on a process pool and are streamed to disk; rerunning resumes from the file
+    outputs = Sweep.carpet_sweep(problem, setup, number_of_points, title + "_sweep.jsonl")
     inputs = outputs.inputs
     objective = outputs.objective
     constraints = outputs.constraint_val
@@ -0,0 +1,256 @@
+# Parallel.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import gc
+import multiprocessing
+from copy import deepcopy
+
+import numpy as np
+from SUAVE.Core import Data
+
+from Cache import scaled_inputs
+# scipy.optimize is imported by SciPy_Solve, the workers only need the evaluation functions
+
+# ----------------------------------------------------------------------
+#   Worker Side
+# ----------------------------------------------------------------------
+
+# every worker process builds its own nexus once and keeps it for the whole pool lifetime
+_nexus = None
+
+# template nexus per setup function, built (once) in the parent and inherited by forked workers
+_templates      = {}
+_template_state = None
+
+
+def template(setup, warm=True):
+    if setup not in _templates:
+        nexus = setup()
+        if warm:
+            # builds the analyses, sizes the engines and fills the module-level caches the workers inherit
+            nexus.evaluate()
+        _templates[setup] = nexus
+
+    return _templates[setup]
+
+
+def initialize_worker(setup):
+    global _nexus
+    _nexus = setup()
+
+
+def initialize_forked_worker(setup):
+    global _nexus, _template_state
+    _nexus          = _templates[setup]
+    _template_state = deepcopy(_nexus.optimization_problem.inputs), _nexus.fidelity_level
+
+    # the template's warm-up evaluation was already counted in the parent's profile
+    if _nexus.get('procedure_profile') is not None:
+        _nexus.procedure_profile.collect()
+
+
+def worker_settings(problem, lock_grid=False):
+    # parent state that is not part of setup(), sent along with every task
+    settings = Data()
+    settings.fidelity_level = problem.fidelity_level
+    settings.hint           = 1.
+    settings.control_points = None
+    settings.unknowns       = None
+
+    adaptive = problem.get('adaptive_discretization')
+    if adaptive is not None:
+        settings.hint = adaptive.hint
+        if lock_grid:
+            # the mission grid chosen at the point problem was last evaluated at (the gradient's base point)
+            settings.control_points = problem.summary.get('control_points')
+
+    warm_start = problem.get('warm_start')
+    if warm_start is not None and lock_grid:
+        # and from the segment unknowns converged there, not from whatever each worker solved last:
+        # different starting points leave different solver residuals, which the step would amplify
+        settings.unknowns = warm_start.converged_at(scaled_inputs(problem.optimization_problem))
+
+    return settings
+
+
+def worker_nexus(settings=None):
+    # a forked worker goes back to the template's inputs before every task
+    if _template_state is not None:
+        inputs, fidelity_level = _template_state
+        _nexus.optimization_problem.inputs = deepcopy(inputs)
+        _nexus.fidelity_level              = fidelity_level
+        _nexus.summary                     = Data()
+        _nexus._last_key                   = None
+
+    # then evaluates the way the parent nexus would
+    if settings is not None:
+        _nexus.fidelity_level = settings.fidelity_level
+        adaptive = _nexus.get('adaptive_discretization')
+        if adaptive is not None:
+            adaptive.hint          = settings.hint
+            adaptive.locked_points = settings.control_points
+        warm_start = _nexus.get('warm_start')
+        if warm_start is not None:
+            warm_start.seed = settings.unknowns
+
+    return _nexus
+
+
+def worker_pool(setup, processes=None):
+    # fork from a pre-built template where the platform allows it, so setup() runs once per machine
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.Pool(processes, initializer=initialize_worker, initargs=(setup,))
+
+    nexus = template(setup)
+    if nexus.get('history') is not None:
+        nexus.history.flush()   # the warm-up row is written once, by the parent
+    gc.collect()
+    if hasattr(gc, 'freeze'):
+        gc.freeze()   # keeps the collector from touching (and so copying) the inherited pages
+
+    pool = multiprocessing.get_context('fork').Pool(processes, initializer=initialize_forked_worker,
+                                                    initargs=(setup,))
+    # the workers are forked by now, the parent collects its own objects as before
+    if hasattr(gc, 'unfreeze'):
+        gc.unfreeze()
+
+    return pool
+
+
+def evaluate_point(task):
+    x, settings = task
+    nexus = worker_nexus(settings)
+
+    objective  = nexus.objective(x)
+    equality   = nexus.equality_constraint(x)
+    inequality = nexus.inequality_constraint(x)
+
+    key = nexus.cache_key() if hasattr(nexus, 'cache_key') else None
+
+    # step timings of this task, merged into the parent's profile
+    profile = nexus.get('procedure_profile')
+    profile = profile.collect() if profile is not None else None
+
+    return key, nexus.summary, np.atleast_1d(objective), np.atleast_1d(equality), np.atleast_1d(inequality), profile
+
+
+def merge_outputs(problem, outputs):
+    # keep what the workers solved (and how long their steps took) on the parent nexus
+    cache   = getattr(problem, 'evaluation_cache', None)
+    profile = problem.get('procedure_profile')
+    for key, summary, _, _, _, collected in outputs:
+        if cache is not None and key is not None:
+            cache.put(key, summary)
+        if profile is not None and collected is not None:
+            profile.merge(collected)
+
+
+# ----------------------------------------------------------------------
+#   Parallel Finite-Difference Gradient
+# ----------------------------------------------------------------------
+
+class Parallel_Gradient(object):
+
+    def __init__(self, problem, setup, processes=None, sense_step=1.4901161193847656e-08):
+        self.problem    = problem
+        self.setup      = setup
+        self.processes  = processes
+        self.sense_step = sense_step
+        self._pool      = None
+        self._last_x    = None
+        self._last      = None
+
+    def _jacobians(self, x):
+        x = np.array(x, dtype=float)
+        if self._last_x is not None and np.array_equal(x, self._last_x):
+            return self._last
+
+        if self._pool is None:
+            self._pool = worker_pool(self.setup, self.processes)
+
+        # SLSQP has already evaluated f and the constraints at x, so the base values come from the
+        # parent nexus (a cache hit) and only the perturbed points go to the pool
+        obj0 = np.atleast_1d(self.problem.objective(x))
+        eq0  = np.atleast_1d(self.problem.equality_constraint(x))
+        ieq0 = np.atleast_1d(self.problem.inequality_constraint(x))
+
+        # every perturbed point is solved on the base point's mission grid
+        settings = worker_settings(self.problem, lock_grid=True)
+        tasks    = []
+        for ii in range(len(x)):
+            point      = x.copy()
+            point[ii] += self.sense_step
+            tasks.append((point, settings))
+
+        outputs = self._pool.map(evaluate_point, tasks)
+
+        # a line search that lands on one of the perturbed points is then answered from the cache as well
+        merge_outputs(self.problem, outputs)
+
+        d_obj = np.zeros((len(x), len(obj0)))
+        d_eq  = np.zeros((len(x), len(eq0)))
+        d_ieq = np.zeros((len(x), len(ieq0)))
+
+        for ii, (_, _, obj, eq, ieq, _) in enumerate(outputs):
+            d_obj[ii] = (obj - obj0) / self.sense_step
+            d_eq[ii]  = (eq - eq0) / self.sense_step
+            d_ieq[ii] = (ieq - ieq0) / self.sense_step
+
+        self._last_x = x
+        self._last   = d_obj[:, 0], d_eq.T, d_ieq.T
+
+        return self._last
+
+    def objective(self, x):
+        return self._jacobians(x)[0]
+
+    def equality_constraint(self, x):
+        return self._jacobians(x)[1]
+
+    def inequality_constraint(self, x):
+        return self._jacobians(x)[2]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+
+# ----------------------------------------------------------------------
+#   SLSQP with Parallel Gradients
+# ----------------------------------------------------------------------
+
+def SciPy_Solve(problem, setup, processes=None, sense_step=1.4901161193847656e-08, iter=200, tolerance=1e-6,
+                callback=None):
+    import scipy.optimize
+
+    inp = problem.optimization_problem.inputs
+
+    # scale the initial point and the bounds the same way scipy_setup does
+    scl  = np.array(inp[:, 4], dtype=float)
+    x    = np.array(inp[:, 1], dtype=float) / scl
+    bnds = np.zeros((len(inp), 2))
+    for ii in range(0, len(inp)):
+        bnds[ii] = (inp[ii, 2] / scl[ii]), (inp[ii, 3] / scl[ii])
+
+    gradient = Parallel_Gradient(problem, setup, processes, sense_step)
+
+    try:
+        outputs = scipy.optimize.fmin_slsqp(problem.objective, x,
+                                         f_eqcons=problem.equality_constraint,
+                                         f_ieqcons=problem.inequality_constraint,
+                                         fprime=gradient.objective,
+                                         fprime_eqcons=gradient.equality_constraint,
+                                         fprime_ieqcons=gradient.inequality_constraint,
+                                         bounds=bnds, iter=iter, acc=tolerance, callback=callback)
+    finally:
+        gradient.close()
+
+    return outputs
@@ -0,0 +1,181 @@
+# Polar.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+
+import numpy as np
+import SUAVE
+from scipy.interpolate import RegularGridInterpolator
+from SUAVE.Analyses.Aerodynamics import Fidelity_Zero
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics, State
+from SUAVE.Core import Data, Units
+
+from Cache import LRU_Cache, fingerprint
+
+# CL/CD tables by airframe geometry, shared by every config and evaluation with the same wings and fuselages
+polar_tables = LRU_Cache(size=32)
+
+# keys written by the weights and balance methods, they do not change the aerodynamics
+geometry_outputs = ['mass_properties', 'weight_breakdown', 'breakdown', 'center_of_gravity',
+                    'zero_fuel_center_of_gravity', 'moments_of_inertia']
+
+# default grid; Reynolds number is per unit length, as in conditions.freestream.reynolds_number
+polar_grid = Data()
+polar_grid.mach_number     = np.linspace(0.1, 0.9, 9)
+polar_grid.angle_of_attack = np.linspace(-5., 15., 11) * Units.deg
+polar_grid.reynolds_number = np.logspace(6., 7.5, 6)
+
+# the nacelle drag in a table is rescaled with the nacelle wetted area, beyond this change the table is rebuilt
+nacelle_tolerance = 0.1
+
+
+# ----------------------------------------------------------------------
+#   Table Generation
+# ----------------------------------------------------------------------
+
+def airframe_key(geometry, settings, grid):
+    return fingerprint([geometry.wings, geometry.fuselages, geometry.reference_area, settings, grid],
+                       exclude=geometry_outputs)
+
+
+def nacelle_area(geometry):
+    area = 0.
+    for propulsor in geometry.propulsors:
+        area += propulsor.areas.wetted * propulsor.number_of_engines
+
+    return area
+
+
+def polar_conditions(mach_number, angle_of_attack, reynolds_number, altitude=10. * Units.km):
+    # temperature and pressure of a cruise atmosphere, only mach, alpha and Re vary over the table
+    rows       = len(mach_number)
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    freestream = atmosphere.compute_values(altitude * np.ones((rows, 1)))
+    velocity   = mach_number[:, None] * freestream.speed_of_sound
+
+    conditions = Aerodynamics()
+    conditions.expand_rows(rows)
+    conditions.freestream.altitude          = altitude * np.ones((rows, 1))
+    conditions.freestream.pressure          = freestream.pressure
+    conditions.freestream.temperature       = freestream.temperature
+    conditions.freestream.density           = freestream.density
+    conditions.freestream.speed_of_sound    = freestream.speed_of_sound
+    conditions.freestream.dynamic_viscosity = freestream.dynamic_viscosity
+    conditions.freestream.mach_number       = mach_number[:, None]
+    conditions.freestream.velocity          = velocity
+    conditions.freestream.dynamic_pressure  = 0.5 * freestream.density * velocity ** 2
+    conditions.freestream.reynolds_number   = reynolds_number[:, None]
+    conditions.freestream.gravity           = 9.81 * np.ones((rows, 1))
+    conditions.aerodynamics.angle_of_attack = angle_of_attack[:, None]
+
+    state = State()
+    state.conditions = conditions
+
+    return state
+
+
+def propulsor_drag(conditions, geometry, rows):
+    # nacelle (and pylon) share of the parasite drag, as written to the drag breakdown by Fidelity_Zero
+    drag = np.zeros(rows)
+    try:
+        parasite = conditions.aerodynamics.drag_breakdown.parasite
+        for propulsor in geometry.propulsors:
+            drag += np.ravel(parasite[propulsor.tag].parasite_drag_coefficient)
+        if 'pylon' in parasite:
+            drag += np.ravel(parasite.pylon.parasite_drag_coefficient)
+    except (KeyError, AttributeError):
+        drag[:] = 0.   # breakdown not available, the table total is used as is
+
+    return drag
+
+
+class Polar_Table(object):
+
+    def __init__(self, aerodynamics, grid):
+        self.axes = (np.array(grid.mach_number, dtype=float), np.array(grid.angle_of_attack, dtype=float),
+                     np.array(grid.reynolds_number, dtype=float))
+        shape = tuple(len(axis) for axis in self.axes)
+
+        # one vectorized pass of the full component build-up over the whole grid
+        M, A, R = [value.reshape(-1) for value in np.meshgrid(*self.axes, indexing='ij')]
+        state   = polar_conditions(M, A, R)
+        results = Fidelity_Zero.evaluate(aerodynamics, state)
+
+        self.lift_coefficient = np.ravel(results.lift.total).reshape(shape)
+        self.drag_coefficient = np.ravel(results.drag.total).reshape(shape)
+        self.nacelle_drag     = propulsor_drag(state.conditions, aerodynamics.geometry, len(M)).reshape(shape)
+        self.nacelle_area     = nacelle_area(aerodynamics.geometry)
+
+        # linear extrapolation in alpha, mach and Re are held at the grid edges
+        self._lift    = RegularGridInterpolator(self.axes, self.lift_coefficient, bounds_error=False, fill_value=None)
+        self._drag    = RegularGridInterpolator(self.axes, self.drag_coefficient, bounds_error=False, fill_value=None)
+        self._nacelle = RegularGridInterpolator(self.axes, self.nacelle_drag, bounds_error=False, fill_value=None)
+
+    def evaluate(self, mach_number, angle_of_attack, reynolds_number, nacelle_area):
+        points = np.column_stack([np.clip(np.ravel(mach_number), self.axes[0][0], self.axes[0][-1]),
+                                  np.ravel(angle_of_attack),
+                                  np.clip(np.ravel(reynolds_number), self.axes[2][0], self.axes[2][-1])])
+
+        CL = self._lift(points)
+        CD = self._drag(points)
+
+        # engine resizing (design_thrust) only scales the nacelle wetted area, so no new table is needed
+        if self.nacelle_area > 0.:
+            CD = CD + self._nacelle(points) * (nacelle_area / self.nacelle_area - 1.)
+
+        return CL[:, None], CD[:, None]
+
+
+# ----------------------------------------------------------------------
+#   Fidelity_Zero Answered from Cached Tables
+# ----------------------------------------------------------------------
+
+class Polar_Aerodynamics(Fidelity_Zero):
+
+    def __defaults__(self):
+        # a per-instance copy, changing one analysis' grid must not change the module default
+        self.polar_grid = deepcopy(polar_grid)
+
+    def initialize(self):
+        # the vortex-lattice surrogate is only trained when a table has to be built
+        pass
+
+    # Fidelity_Zero aliases finalize to initialize, and the procedure's finalize step calls it every evaluation
+    finalize = initialize
+
+    def polar_table(self):
+        geometry = self.geometry
+        key      = airframe_key(geometry, self.settings, self.polar_grid)
+        table    = polar_tables.get(key)
+
+        area = nacelle_area(geometry)
+        if table is not None and (table.nacelle_area == 0. or
+                                  abs(area / table.nacelle_area - 1.) <= nacelle_tolerance):
+            return table, area
+
+        Fidelity_Zero.initialize(self)
+        table = Polar_Table(self, self.polar_grid)
+        polar_tables.put(key, table)
+
+        return table, area
+
+    def evaluate(self, state):
+        conditions  = state.conditions
+        table, area = self.polar_table()
+
+        CL, CD = table.evaluate(conditions.freestream.mach_number, conditions.aerodynamics.angle_of_attack,
+                                conditions.freestream.reynolds_number, area)
+
+        results = Data()
+        results.lift = Data()
+        results.lift.total = CL
+        results.drag = Data()
+        results.drag.total = CD
+
+        return results
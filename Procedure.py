@@ -12,26 +12,25 @@ import numpy as np
 import os
 from SUAVE.Analyses.Process import Process
 from SUAVE.Core import Units, Data
-from SUAVE.Input_Output.Results import print_parasite_drag, \
-    print_compress_drag, \
-    print_weight_breakdown
 from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift.compute_max_lift_coeff import compute_max_lift_coeff
 # from SUAVE.Methods.Center_of_Gravity.compute_aircraft_center_of_gravity import compute_aircraft_center_of_gravity
 from SUAVE.Methods.Center_of_Gravity.compute_component_centers_of_gravity import compute_component_centers_of_gravity
-from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Propulsion.compute_turbofan_geometry import \
-    compute_turbofan_geometry
 from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_planform
-from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
-from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
 from SUAVE.Methods.Performance import estimate_landing_field_length
 from SUAVE.Methods.Performance import estimate_take_off_field_length
-from SUAVE.Methods.Propulsion.turbofan_sizing import turbofan_sizing
-from SUAVE.Optimization import write_optimization_outputs
+# plotting, noise (noise_airframe_Fink, noise_SAE), print_* and output helpers are imported where they are used
 
-from supporting.print_engine_data import print_engine_data
-from supporting.print_mission_breakdown import print_mission_breakdown
+from Breguet import breguet_mission
+from Cache import scaled_inputs
+from Incremental import Step
+from Results_Store import flatten_mission, segment_rows
+from Telemetry import DETAIL, record
+from Weight_Cache import evaluate_weights
+from engine import size_turbofan
 
 numpy_export = False
+incremental = True  # skip procedure steps whose declared inputs did not change since their last run
+full_fidelity_level = 1  # nexus.fidelity_level below this runs the closed-form Breguet cruise instead
 
 
 # ---------------------------------------------------------------------
@@ -45,6 +44,9 @@ def setup():
     #   Analysis Procedure
     # ------------------------------------------------------------------
 
+    if incremental:
+        return incremental_setup()
+
     # size the base config
     # procedure = Data()
     procedure = Process()
@@ -71,6 +73,95 @@ def setup():
     return procedure
 
 
+# ----------------------------------------------------------------------
+#   Incremental Analysis Procedure
+# ----------------------------------------------------------------------
+
+# [ 'alias path', ... ] read by each step, same syntax as problem.aliases
+wing_inputs = [
+    'vehicle_configurations.*.wings.*.areas.reference',
+    'vehicle_configurations.*.wings.*.aspect_ratio',
+    'vehicle_configurations.*.wings.*.taper',
+    'vehicle_configurations.*.wings.*.sweeps.quarter_chord',
+    'vehicle_configurations.*.wings.*.thickness_to_chord',
+]
+
+wing_geometry = [
+    'vehicle_configurations.*.wings.*.areas',
+    'vehicle_configurations.*.wings.*.spans',
+    'vehicle_configurations.*.wings.*.chords',
+    'vehicle_configurations.*.wings.*.aspect_ratio',
+    'vehicle_configurations.*.wings.*.taper',
+    'vehicle_configurations.*.wings.*.sweeps',
+    'vehicle_configurations.*.wings.*.thickness_to_chord',
+]
+
+fuselage_geometry = [
+    'vehicle_configurations.*.fuselages.*.lengths',
+    'vehicle_configurations.*.fuselages.*.areas',
+    'vehicle_configurations.*.fuselages.*.width',
+    'vehicle_configurations.*.fuselages.*.heights',
+    'vehicle_configurations.*.fuselages.*.effective_diameter',
+    'vehicle_configurations.*.fuselages.*.differential_pressure',
+]
+
+engine_inputs = [
+    'vehicle_configurations.*.propulsors.turbofan.thrust.total_design',
+    'vehicle_configurations.*.propulsors.turbofan.bypass_ratio',
+    'vehicle_configurations.*.propulsors.turbofan.number_of_engines',
+    'missions.base.segments.cruise.air_speed',
+]
+
+engine_geometry = [
+    'vehicle_configurations.*.propulsors.turbofan.sealevel_static_thrust',
+    'vehicle_configurations.*.propulsors.turbofan.number_of_engines',
+    'vehicle_configurations.*.propulsors.turbofan.engine_length',
+    'vehicle_configurations.*.propulsors.turbofan.nacelle_diameter',
+    'vehicle_configurations.*.propulsors.turbofan.areas',
+]
+
+mass_inputs = [
+    'vehicle_configurations.*.mass_properties.max_takeoff',
+    'vehicle_configurations.*.mass_properties.takeoff',
+    'vehicle_configurations.*.mass_properties.max_payload',
+    'vehicle_configurations.*.mass_properties.payload',
+]
+
+
+def incremental_setup():
+    procedure = Process()
+
+    # geometry and engine are sized separately so that e.g. an MTOW change re-runs neither
+    procedure.simple_sizing                 = Process()
+    procedure.simple_sizing.geometry        = Step(size_geometry,
+                                                   reads  = wing_inputs,
+                                                   writes = wing_geometry + fuselage_geometry)
+    procedure.simple_sizing.engine          = Step(size_engine,
+                                                   reads  = engine_inputs,
+                                                   writes = engine_geometry)
+
+    procedure.weights                       = Step(weight,
+                                                   reads  = mass_inputs + wing_geometry + fuselage_geometry
+                                                            + engine_geometry,
+                                                   writes = ['vehicle_configurations.*.mass_properties',
+                                                             'summary.MTOW', 'summary.BOW'])
+
+    procedure.finalize                      = Step(finalize,
+                                                   reads  = wing_geometry + fuselage_geometry + engine_geometry,
+                                                   writes = ['analyses'])
+
+    # the mission depends on (nearly) the whole vehicle state
+    procedure.missions                      = Process()
+    procedure.missions.design_mission       = Step(design_mission,
+                                                   reads  = ['vehicle_configurations', 'fidelity_level'],
+                                                   writes = ['results.base', 'results.columns',
+                                                             'summary.control_points'])
+
+    procedure.post_process                  = post_process
+
+    return procedure
+
+
 # ----------------------------------------------------------------------
 #   Target Range Function
 # ----------------------------------------------------------------------
@@ -119,7 +210,7 @@ def takeoff_field_length(nexus):
 
     takeoff_field_length = estimate_tofl(config, analyses.base, takeoff_airport)
 
-    print ('TOFL: '+str('%5.1f' % takeoff_field_length)+' m')
+    record('takeoff_field_length', takeoff_field_length=takeoff_field_length)
 
     # pack results
     summary.takeoff_field_length = takeoff_field_length
@@ -144,8 +235,8 @@ def landing_field_length(nexus):
 
     landing_field_length = estimate_landing(config, analyses, landing_airport)
 
-    print ('LFL for MLW (' + str('%5.1f' % config.mass_properties.landing) + ' kg): ' +
-           str('%5.1f' % landing_field_length) + ' m')
+    record('landing_field_length', landing_weight=config.mass_properties.landing,
+           landing_field_length=landing_field_length)
 
     # pack results
     summary.landing_field_length = landing_field_length
@@ -172,8 +263,7 @@ def evaluate_field_length(configs, analyses, mission, results):
     field_length.takeoff = TOFL[0]
     field_length.landing = LFL[0]
 
-    print("Takeoff field length: ", TOFL[0])
-    print("Landing field length: ", LFL[0])
+    record('field_length', takeoff=TOFL[0], landing=LFL[0])
 
     results.field_length = field_length
     return results
@@ -183,24 +273,58 @@ def evaluate_field_length(configs, analyses, mission, results):
 #   Design Mission
 # ----------------------------------------------------------------------
 def design_mission(nexus):
-    mission = nexus.missions.base
-    mission.design_range = 1200. * Units['km']  # 1.2 * Cruise_range (requirement) for safety
-    find_target_range(nexus, mission)
+    mission = setup_design_mission(nexus)
 
     results = nexus.results
-    results.base = mission.evaluate()
+    if nexus.fidelity_level < full_fidelity_level:
+        results.base = breguet_mission(nexus)
+    else:
+        warm_start = nexus.get('warm_start')
+        x = scaled_inputs(nexus.optimization_problem)
+        adaptive = nexus.get('adaptive_discretization')
+        if warm_start is not None:
+            warm_start.apply(x, mission)
+        if adaptive is not None:
+            results.base = adaptive.evaluate(mission)
+            nexus.summary.control_points = adaptive.number_of_points  # the grid the gradient points have to reuse
+        else:
+            results.base = mission.evaluate()
+        if warm_start is not None:
+            warm_start.store(x, results.base)
+
+    # post processing reads the flat columns only, the segment tree can go once they are stored
+    results.columns = flatten_mission(results.base)
+    store = nexus.get('results_store')
+    if store is not None:
+        store.append(results.columns, scaled_inputs(nexus.optimization_problem))
+        if not store.keep_mission_results:
+            results.base = None
 
     return nexus
 
 
+def setup_design_mission(nexus):
+    mission = nexus.missions.base
+    mission.design_range = 1200. * Units['km']  # 1.2 * Cruise_range (requirement) for safety
+    find_target_range(nexus, mission)
+
+    return mission
+
+
 # ----------------------------------------------------------------------
 #   Sizing
 # ----------------------------------------------------------------------
 
 def simple_sizing(nexus):
-    configs = nexus.vehicle_configurations
-    base = configs.base
+    size_geometry(nexus)
+    size_engine(nexus)
 
+    # done!
+
+    return nexus
+
+
+def sizing_conditions(nexus):
     # find conditions
     air_speed = nexus.missions.base.segments['cruise'].air_speed
     altitude = 10 * Units.km
@@ -211,8 +335,6 @@ def simple_sizing(nexus):
     freestream0 = atmosphere.compute_values(6000. * Units.ft)  # cabin altitude / Source -> Google
 
     diff_pressure         = np.max(freestream0.pressure-freestream.pressure, 0)
-    fuselage = base.fuselages['fuselage']
-    fuselage.differential_pressure = diff_pressure
 
     # now size engine
     mach_number = air_speed / freestream.speed_of_sound
@@ -226,6 +348,23 @@ def simple_sizing(nexus):
     conditions.freestream = freestream
     # conditions.weights.vehicle_mass_rate = -200 * Units['kg/s']
 
+    return conditions, mach_number, altitude, diff_pressure
+
+
+def size_geometry(nexus):
+    configs = nexus.vehicle_configurations
+    base = configs.base
+
+    conditions, mach_number, altitude, diff_pressure = sizing_conditions(nexus)
+
+    fuselage = base.fuselages['fuselage']
+    fuselage.differential_pressure = diff_pressure
+
+    # bring the configs' own copies of the base's nodes up to date before they are sized
+    for config in configs:
+        if config is not base:
+            config.pull_base()
+
     for config in configs:
         # keeping tail volume constant with wings. Maybe later
         # config.wings.horizontal_stabilizer.areas.reference = (26.0 / 92.0) * config.wings.main_wing.areas.reference
@@ -241,12 +380,23 @@ def simple_sizing(nexus):
         fuselage = config.fuselages['fuselage']
         fuselage.differential_pressure = diff_pressure
 
-        turbofan_sizing(config.propulsors['turbofan'], mach_number, altitude)
-        compute_turbofan_geometry(config.propulsors['turbofan'], conditions)  # engine_length, nacelle_diameter, Swet
         # diff the new data
         config.store_diff()
 
-    # done!
+    return nexus
+
+
+def size_engine(nexus):
+    configs = nexus.vehicle_configurations
+
+    conditions, mach_number, altitude, diff_pressure = sizing_conditions(nexus)
+
+    for config in configs:
+        # identical engines are sized once and the same sized turbofan is shared by every config
+        config.propulsors['turbofan'] = size_turbofan(config.propulsors['turbofan'], mach_number, altitude,
+                                                      conditions)
+        # diff the new data
+        config.store_diff()
 
     return nexus
 
@@ -263,12 +413,13 @@ def weight(nexus):
     #     config.mass_properties.max_takeoff   = vehicle.mass_properties.max_takeoff
 
     # weight analysis
-    weights = nexus.analyses.base.weights.evaluate()
+    # configs that differ only in flap settings share one evaluation through the weight cache
+    weights = evaluate_weights(nexus.analyses.base.weights)
     compute_component_centers_of_gravity(vehicle)
 
-    weights = nexus.analyses.cruise.weights.evaluate()
-    weights = nexus.analyses.landing.weights.evaluate()
-    weights = nexus.analyses.takeoff.weights.evaluate()
+    weights = evaluate_weights(nexus.analyses.cruise.weights)
+    weights = evaluate_weights(nexus.analyses.landing.weights)
+    weights = evaluate_weights(nexus.analyses.takeoff.weights)
     vehicle.mass_properties.breakdown = weights
 
     for config in nexus.vehicle_configurations:
@@ -309,15 +460,9 @@ def post_process(nexus):
 
     # -----------------------------------------------------------------------------------------------------------------
     # throttle in design mission
-    max_throttle = 0
-    min_throttle = 0
-    for segment in results.base.segments.values():
-        max_segment_throttle = np.max(segment.conditions.propulsion.throttle[:, 0])
-        min_segment_throttle = np.min(segment.conditions.propulsion.throttle[:, 0])
-        if max_segment_throttle > max_throttle:
-            max_throttle = max_segment_throttle
-        if min_segment_throttle < min_throttle:
-            min_throttle = min_segment_throttle
+    columns = results.columns
+    max_throttle = max(0, np.max(columns.throttle))
+    min_throttle = min(0, np.min(columns.throttle))
 
     summary.max_throttle = max_throttle
     summary.min_throttle = min_throttle
@@ -330,7 +475,7 @@ def post_process(nexus):
     payload = vehicle.mass_properties.payload
     max_payload = vehicle.mass_properties.max_payload
     summary.max_payload = max_payload
-    design_landing_weight = results.base.segments[-1].conditions.weights.total_mass[-1]
+    design_landing_weight = columns.total_mass[-1]
     design_takeoff_weight = vehicle.mass_properties.takeoff
     max_takeoff_weight = nexus.vehicle_configurations.takeoff.mass_properties.max_takeoff
     zero_fuel_weight = nexus.vehicle_configurations.takeoff.mass_properties.max_zero_fuel
@@ -341,16 +486,16 @@ def post_process(nexus):
     summary.fuel_margin = design_landing_weight - operating_empty - max_payload
     summary.max_zero_fuel_margin  = (design_landing_weight - zero_fuel_weight)/zero_fuel_weight
 
-    print("zero fuel weight: ", zero_fuel_weight, "kg  i.e. (", payload, "+", operating_empty, ")")
+    record('post_process', zero_fuel_weight=zero_fuel_weight, payload=payload, operating_empty=operating_empty)
     # print("MTOW selected: ", vehicle.mass_properties.takeoff, "kg, MTOW calculated: ",
     #       zero_fuel_weight + summary.base_mission_fuelburn)
-    print("Max/Min throttle: ", summary.max_throttle, ", ", summary.min_throttle)
+    record('post_process', max_throttle=summary.max_throttle, min_throttle=summary.min_throttle)
 #    print("Take-off field length: ", summary.takeoff_field_length[0], "m")
 #    print("Landing field length: ", summary.landing_field_length[0], "m")
-    summary.mission_range = results.base.segments['cruise'].conditions.frames.inertial.position_vector[:, 0][-1] / 1000
-    print("Mission Range (must be at least 1000km): ", summary.mission_range, " km")
-    summary.total_range = results.base.segments[-1].conditions.frames.inertial.position_vector[:, 0][-1] / 1000.
-    print("Total Range: ", summary.total_range, " km", "(+", summary.total_range - summary.mission_range, ")")
+    summary.mission_range = columns.position_x[segment_rows(columns, 'cruise')][-1] / 1000
+    record('post_process', mission_range=summary.mission_range)  # km, must be at least 1000
+    summary.total_range = columns.position_x[-1] / 1000.
+    record('post_process', total_range=summary.total_range, reserve_range=summary.total_range - summary.mission_range)
     # summary.main_mission_time = (results.base.segments['descent'].conditions.frames.inertial.time[-1] -
     #                              results.base.segments[0].conditions.frames.inertial.time[0])
     # summary.total_mission_time = (results.base.segments[-1].conditions.frames.inertial.time[-1] -
@@ -359,25 +504,18 @@ def post_process(nexus):
     #     (summary.total_mission_time - summary.main_mission_time)[0] * Units['s'] / Units.h, "hours (diversion)")
     summary.nothing = 0.0
     # print('Fuel burn: ', summary.base_mission_fuelburn, " Fuel margin: ", summary.max_zero_fuel_margin)
-    clmax = 0
-    for segment in results.base.segments.values():
-        cl = np.max(segment.conditions.aerodynamics.lift_coefficient[:, 0])
-        if cl > clmax:
-            clmax = cl
-
-    summary.clmax = clmax
-    print("CL_max: ", summary.clmax)
+    summary.clmax = max(0, np.max(columns.lift_coefficient))
+    record('post_process', clmax=summary.clmax)
 
     gt_engine = nexus.vehicle_configurations.base.propulsors.turbofan
-    # FIXME move that to printing/results section
-    print("Turbofan thrust:", gt_engine.sealevel_static_thrust, " x ", int(
-        gt_engine.number_of_engines), "engines (tot: ", gt_engine.sealevel_static_thrust * gt_engine.number_of_engines,
-          " N)")
-    print("Thrust required: ", gt_engine.design_thrust, "N")
-    print("Estimated engine length: ", gt_engine.engine_length, ", diameter: ", gt_engine.nacelle_diameter,
-          ", wetted area: ", gt_engine.areas.wetted)
+    record('engine', DETAIL,
+           sealevel_static_thrust=gt_engine.sealevel_static_thrust, number_of_engines=gt_engine.number_of_engines,
+           total_thrust=gt_engine.sealevel_static_thrust * gt_engine.number_of_engines,
+           design_thrust=gt_engine.design_thrust, engine_length=gt_engine.engine_length,
+           nacelle_diameter=gt_engine.nacelle_diameter, wetted_area=gt_engine.areas.wetted)
 
     # #when you run want to output results to a file
+    # from SUAVE.Optimization import write_optimization_outputs
     # filename = 'results.txt'
     # write_optimization_outputs(nexus, filename)
 
@@ -0,0 +1,36 @@
+# Process_Local.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+from multiprocessing import util
+
+
+# ----------------------------------------------------------------------
+#   State Owned by One Process
+# ----------------------------------------------------------------------
+
+class Process_Local(object):
+    # base of the logs and stores whose buffers and files belong to the process that filled them.
+    # A forked worker inherits the object but must not write the parent's buffered state, and it does
+    # not inherit the finalizer either: multiprocessing clears its registry after a fork. So on first
+    # use in a new process _reset() runs and flush() (if any) is registered again, which also covers
+    # the normal exit of pool workers, where atexit does not run.
+
+    _pid = None
+
+    def _check_process(self):
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._reset()
+            flush = getattr(self, 'flush', None)
+            if flush is not None:
+                util.Finalize(self, flush, exitpriority=10)
+
+    def _reset(self):
+        pass
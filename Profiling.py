@@ -0,0 +1,200 @@
+# Profiling.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import cProfile
+import pstats
+import time
+from collections import OrderedDict
+
+
+# ----------------------------------------------------------------------
+#   Timed Procedure Step
+# ----------------------------------------------------------------------
+
+class Profiled_Step(object):
+
+    def __init__(self, step, name, profile):
+        self.step    = step
+        self.name    = name
+        self.profile = profile
+        self.leaf    = not hasattr(step, 'items')   # sub-processes are only timed, their steps carry the profiles
+
+        profile.steps[name] = self
+
+        self.calls     = 0
+        self.wall_time = 0.
+        self.cpu_time  = 0.
+        self.profiler  = cProfile.Profile() if self.leaf and profile.use_cprofile else None
+        self.merged    = None   # pstats.Stats of the calls pool workers made for this step
+
+    def __getattr__(self, key):
+        # evaluation_count, reset, values, ... of the wrapped step
+        if key == 'step':
+            raise AttributeError(key)
+        return getattr(self.step, key)
+
+    def evaluate(self, *args, **kwargs):
+        function  = self.step.evaluate if hasattr(self.step, 'evaluate') else self.step
+        wall, cpu = time.perf_counter(), time.process_time()
+        if self.profiler is not None:
+            self.profiler.enable()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
+            self.calls     += 1
+            self.wall_time += time.perf_counter() - wall
+            self.cpu_time  += time.process_time() - cpu
+
+    __call__ = evaluate
+
+    def profile_stats(self):
+        # own profile plus the ones merged from the workers, None if the step was never profiled
+        stats   = self.merged
+        entries = profile_entries(self.profiler) if self.profiler is not None else {}
+        if entries:
+            own = pstats.Stats(Profile_Entries(entries))
+            if stats is not None:
+                own.add(stats)
+            stats = own
+
+        return stats
+
+
+class Profile_Entries(object):
+    # pstats.Stats loads anything with create_stats() and a stats dict, e.g. entries sent back by a worker
+
+    def __init__(self, stats):
+        self.stats = dict(stats)
+
+    def create_stats(self):
+        pass
+
+
+def profile_entries(profiler):
+    # { function : (calls, primitive calls, self time, cumulative time, callers) }, picklable
+    profiler.create_stats()
+
+    return profiler.stats
+
+
+# ----------------------------------------------------------------------
+#   Run-Wide Aggregation
+# ----------------------------------------------------------------------
+
+class Procedure_Profile(object):
+
+    def __init__(self, use_cprofile=True):
+        self.use_cprofile = use_cprofile
+        self.steps        = OrderedDict()   # 'missions.design_mission' -> Profiled_Step
+
+    def instrument(self, procedure, prefix=''):
+        # wrap every step of the process (and of its sub-processes) in place
+        for tag, step in list(procedure.items()):
+            if isinstance(step, Profiled_Step):
+                continue
+            name = prefix + tag
+            procedure[tag] = Profiled_Step(step, name, self)
+            if hasattr(step, 'items'):
+                self.instrument(step, name + '.')
+
+        return procedure
+
+    def collect(self):
+        # worker side: timings and profiles since the last collect, the step counters start over
+        collected = OrderedDict()
+        for name, step in self.steps.items():
+            entries = profile_entries(step.profiler) if step.profiler is not None else {}
+            collected[name] = step.calls, step.wall_time, step.cpu_time, entries
+
+            step.calls, step.wall_time, step.cpu_time = 0, 0., 0.
+            if step.profiler is not None:
+                step.profiler = cProfile.Profile()
+
+        return collected
+
+    def merge(self, collected):
+        # parent side: add what a pool worker collected, so the report covers the whole run
+        for name, (calls, wall_time, cpu_time, entries) in collected.items():
+            step = self.steps.get(name)
+            if step is None:
+                continue
+            step.calls     += calls
+            step.wall_time += wall_time
+            step.cpu_time  += cpu_time
+            if entries:
+                stats = pstats.Stats(Profile_Entries(entries))
+                if step.merged is None:
+                    step.merged = stats
+                else:
+                    step.merged.add(stats)
+
+    def summary_table(self):
+        total = sum(step.wall_time for step in self.steps.values() if '.' not in step.name)
+
+        lines = ['%-36s %8s %12s %12s %12s %7s' % ('step', 'calls', 'wall [s]', 'cpu [s]', 'per call [s]', 'wall %')]
+        for name, step in self.steps.items():
+            depth = name.count('.')
+            lines.append('%-36s %8d %12.4f %12.4f %12.6f %6.1f%%' % (
+                '  ' * depth + name.split('.')[-1], step.calls, step.wall_time, step.cpu_time,
+                step.wall_time / max(step.calls, 1), 100. * step.wall_time / total if total > 0. else 0.))
+
+        return '\n'.join(lines)
+
+    def stats(self, name):
+        return self.steps[name].profile_stats()
+
+    def write_collapsed(self, filename, minimum_fraction=1e-4):
+        # "step;caller;...;function microseconds" lines for flamegraph.pl / speedscope
+        stacks = {}
+        for name, step in self.steps.items():
+            stats = step.profile_stats()
+            if stats is None:
+                continue
+            prefix = name.split('.')
+            entries = stats.stats
+            minimum = minimum_fraction * step.wall_time
+            for function, (_, _, self_time, _, _) in entries.items():
+                for path, fraction in call_paths(entries, function, 1., self_time, minimum, ()):
+                    key = ';'.join(prefix + [function_label(f) for f in path])
+                    stacks[key] = stacks.get(key, 0.) + self_time * fraction
+
+        with open(filename, 'w') as collapsed:
+            for key, seconds in sorted(stacks.items()):
+                if seconds > 0.:
+                    collapsed.write('%s %d\n' % (key, max(1, int(round(seconds * 1e6)))))
+
+        return filename
+
+
+# ----------------------------------------------------------------------
+#   Call Paths from Caller Statistics
+# ----------------------------------------------------------------------
+
+def function_label(function):
+    filename, line, name = function
+    return '%s:%d:%s' % (filename.split('/')[-1], line, name) if line else name
+
+
+def call_paths(entries, function, fraction, self_time, minimum, visited):
+    # cProfile keeps caller -> callee edges only, so a function's own time is split over its
+    # callers in proportion to the cumulative time each caller spent in it
+    callers = dict((caller, edge) for caller, edge in entries[function][4].items()
+                   if caller in entries and caller not in visited)
+    total   = sum(edge[3] for edge in callers.values())
+
+    if not callers or total <= 0. or self_time * fraction < minimum:
+        yield (function,), fraction
+        return
+
+    for caller, edge in callers.items():
+        for path, path_fraction in call_paths(entries, caller, fraction * edge[3] / total, self_time, minimum,
+                                              visited + (function,)):
+            yield path + (function,), path_fraction
@@ -0,0 +1,175 @@
+# Results_Store.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import json
+import os
+
+import numpy as np
+from SUAVE.Core import Data
+
+from Process_Local import Process_Local
+
+# [ column, path in segment.conditions, column of that array ]
+mission_columns = [
+    ['time',              'frames.inertial.time',             0],
+    ['position_x',        'frames.inertial.position_vector',  0],
+    ['altitude',          'freestream.altitude',              0],
+    ['throttle',          'propulsion.throttle',              0],
+    ['angle_of_attack',   'aerodynamics.angle_of_attack',     0],
+    ['lift_coefficient',  'aerodynamics.lift_coefficient',    0],
+    ['drag_coefficient',  'aerodynamics.drag_coefficient',    0],
+    ['total_mass',        'weights.total_mass',               0],
+    ['vehicle_mass_rate', 'weights.vehicle_mass_rate',        0],
+]
+
+
+# ----------------------------------------------------------------------
+#   Flatten Segment Conditions into Columns
+# ----------------------------------------------------------------------
+
+def conditions_column(conditions, path, column, rows):
+    value = conditions
+    try:
+        for key in path.split('.'):
+            value = value[key]
+        return np.array(value, dtype=float)[:, column]
+    except (KeyError, AttributeError, TypeError, IndexError):
+        return np.full(rows, np.nan)
+
+
+def flatten_mission(results):
+    # one contiguous float64 column per quantity, segments one after the other
+    columns  = Data()
+    segments = []
+    blocks   = dict((name, []) for name, _, _ in mission_columns)
+
+    start = 0
+    for tag, segment in results.segments.items():
+        conditions = segment.conditions
+        rows = np.shape(conditions.frames.inertial.time)[0]
+        for name, path, column in mission_columns:
+            blocks[name].append(conditions_column(conditions, path, column, rows))
+        segments.append([tag, start, start + rows])
+        start += rows
+
+    for name, _, _ in mission_columns:
+        columns[name] = np.concatenate(blocks[name])
+    columns.segments = segments
+
+    return columns
+
+
+def segment_rows(columns, tag):
+    for segment_tag, start, stop in columns.segments:
+        if segment_tag == tag:
+            return slice(start, stop)
+
+    raise KeyError(tag)
+
+
+# ----------------------------------------------------------------------
+#   Append-Only Memory-Mapped Store
+# ----------------------------------------------------------------------
+
+class Results_Store(Process_Local):
+    # one raw float64 file per column (<prefix>.<column>.f8), so every column reads back contiguous,
+    # plus <prefix>.index with one json line per evaluation
+
+    def __init__(self, prefix, keep_mission_results=True):
+        self.prefix_pattern       = prefix                 # {pid} is filled in per process, forked workers included
+        self.keep_mission_results = keep_mission_results   # False -> nexus.results.base is dropped after flattening
+        self.names                = [name for name, _, _ in mission_columns]
+        self._check_process()
+
+    def _reset(self):
+        self.prefix         = self.prefix_pattern.format(pid=self._pid)
+        self.index_filename = self.prefix + '.index'
+        self._index         = self._read_index()
+
+    def column_filename(self, name):
+        return '%s.%s.f8' % (self.prefix, name)
+
+    def _read_index(self):
+        index = {}
+        if os.path.exists(self.index_filename):
+            with open(self.index_filename) as index_file:
+                for line in index_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    index[record['evaluation']] = record
+
+        return index
+
+    @property
+    def number_of_rows(self):
+        # only rows covered by the index count, anything past them is an interrupted append
+        return max([record['row'] + record['rows'] for record in self._index.values()] or [0])
+
+    def append(self, columns, inputs=None):
+        self._check_process()
+        evaluation = len(self._index)
+        start      = self.number_of_rows
+        rows       = len(columns[self.names[0]])
+
+        for name in self.names:
+            with open(self.column_filename(name), 'ab') as data_file:
+                data_file.truncate(start * 8)
+                np.ascontiguousarray(columns[name], dtype=np.float64).tofile(data_file)
+
+        # the index line is written last, so a crash never indexes half-written rows
+        record = dict(evaluation=evaluation, row=start, rows=rows, segments=columns.segments,
+                      inputs=None if inputs is None else [float(value) for value in inputs])
+        with open(self.index_filename, 'a') as index_file:
+            index_file.write(json.dumps(record) + '\n')
+        self._index[evaluation] = record
+
+        return record
+
+    def evaluations(self):
+        self._check_process()
+        return sorted(self._index.keys())
+
+    def column(self, name):
+        # every stored value of one column, as a read-only contiguous memory map
+        self._check_process()
+        if self.number_of_rows == 0:
+            return np.zeros(0)
+        return np.memmap(self.column_filename(name), dtype=np.float64, mode='r', shape=(self.number_of_rows,))
+
+    def table(self):
+        # (rows x columns) copy of everything stored, for exports; column() does not copy
+        return np.column_stack([self.column(name) for name in self.names])
+
+    def read(self, evaluation):
+        self._check_process()
+        record = self._index[evaluation]
+        rows   = slice(record['row'], record['row'] + record['rows'])
+
+        columns = Data()
+        for name in self.names:
+            columns[name] = self.column(name)[rows]
+        columns.segments = record['segments']  # offsets are relative to the evaluation's first row
+
+        return columns
+
+
+# one store per prefix in each process: a second setup() (the worker pool's template) appending through its
+# own copy of the index would overwrite the other's rows and reuse its evaluation numbers
+results_stores = {}
+
+
+def results_store(prefix, keep_mission_results=True):
+    if prefix not in results_stores:
+        results_stores[prefix] = Results_Store(prefix, keep_mission_results)
+    store = results_stores[prefix]
+    store.keep_mission_results = keep_mission_results
+
+    return store
@@ -0,0 +1,71 @@
+# Sampling.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+#   Unit Hypercube Designs
+# ----------------------------------------------------------------------
+
+def latin_hypercube(number_of_points, number_of_variables, seed=None):
+    # one point in every row and column stratum, randomly placed inside its cell
+    rng = np.random.default_rng(seed)
+    u   = np.zeros((number_of_points, number_of_variables))
+    for ii in range(number_of_variables):
+        u[:, ii] = (rng.permutation(number_of_points) + rng.random(number_of_points)) / number_of_points
+
+    return u
+
+
+def sobol(number_of_points, number_of_variables, seed=None):
+    # scrambled Sobol sequence, lower discrepancy than a Latin hypercube of the same size
+    from scipy.stats import qmc   # scipy.stats is slow to import and only needed here
+    sampler = qmc.Sobol(number_of_variables, scramble=True, seed=seed)
+
+    return sampler.random(number_of_points)
+
+
+def full_factorial(levels, number_of_variables):
+    # every combination of evenly spaced levels, the last variable varying fastest
+    levels = np.broadcast_to(levels, (number_of_variables,))
+    axes   = [np.linspace(0., 1., n) if n > 1 else np.array([0.5]) for n in levels]
+
+    return np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, number_of_variables)
+
+
+def unit_design(method, number_of_points, number_of_variables, seed=None):
+    designs = dict(lhs=latin_hypercube, sobol=sobol)
+
+    return designs[method](number_of_points, number_of_variables, seed)
+
+
+# ----------------------------------------------------------------------
+#   Map to the Optimization Problem
+# ----------------------------------------------------------------------
+
+def scaled_bounds(inputs):
+    # [ tag, initial, lower, upper, scaling, units ] -> bounds as the optimizer sees them
+    scale = np.array(inputs[:, 4], dtype=float)
+    lower = np.array(inputs[:, 2], dtype=float) / scale
+    upper = np.array(inputs[:, 3], dtype=float) / scale
+
+    return lower, upper
+
+
+def to_scaled_inputs(u, inputs):
+    lower, upper = scaled_bounds(inputs)
+
+    return lower + u * (upper - lower)
+
+
+def to_unit(x, inputs):
+    lower, upper = scaled_bounds(inputs)
+
+    return (np.asarray(x, dtype=float) - lower) / (upper - lower)
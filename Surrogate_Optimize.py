@@ -0,0 +1,204 @@
+# Surrogate_Optimize.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+
+import numpy as np
+import scipy.linalg
+import scipy.optimize
+import scipy.stats
+from SUAVE.Core import Data
+
+import Parallel
+import Sampling
+
+
+# ----------------------------------------------------------------------
+#   Gaussian Process (squared exponential, one length scale per input)
+# ----------------------------------------------------------------------
+
+class Gaussian_Process(object):
+
+    def __init__(self, noise=1e-8):
+        self.noise      = noise
+        self.log_length = None
+
+    def _kernel(self, A, B, length):
+        d = (A[:, None, :] - B[None, :, :]) / length
+        return np.exp(-0.5 * np.sum(d ** 2, axis=-1))
+
+    def _negative_log_likelihood(self, log_length, X, y):
+        K = self._kernel(X, X, np.exp(log_length)) + self.noise * np.eye(len(X))
+        try:
+            L = np.linalg.cholesky(K)
+        except np.linalg.LinAlgError:
+            return 1e10
+
+        alpha = scipy.linalg.cho_solve((L, True), y)
+
+        return 0.5 * y.dot(alpha) + np.sum(np.log(np.diag(L)))
+
+    def fit(self, X, y, optimize=True):
+        # inputs on the unit cube, outputs standardized
+        self.X    = np.array(X, dtype=float)
+        self.mean = np.mean(y)
+        self.std  = np.std(y) if np.std(y) > 0. else 1.
+        y         = (np.array(y, dtype=float) - self.mean) / self.std
+
+        if optimize or self.log_length is None:
+            bounds = [(np.log(1e-2), np.log(1e1))] * self.X.shape[1]
+            best   = None
+            for start in [0.3, 1.0]:
+                x0     = np.log(start) * np.ones(self.X.shape[1])
+                result = scipy.optimize.minimize(self._negative_log_likelihood, x0, args=(self.X, y),
+                                                 method='L-BFGS-B', bounds=bounds)
+                if best is None or result.fun < best.fun:
+                    best = result
+            self.log_length = best.x
+
+        K = self._kernel(self.X, self.X, np.exp(self.log_length)) + self.noise * np.eye(len(self.X))
+        self._L     = np.linalg.cholesky(K)
+        self._alpha = scipy.linalg.cho_solve((self._L, True), y)
+
+        return self
+
+    def predict(self, X):
+        Ks  = self._kernel(np.array(X, dtype=float), self.X, np.exp(self.log_length))
+        mu  = Ks.dot(self._alpha)
+        v   = scipy.linalg.solve_triangular(self._L, Ks.T, lower=True)
+        var = np.maximum(1. - np.sum(v ** 2, axis=0), 1e-12)
+
+        return mu * self.std + self.mean, np.sqrt(var) * self.std
+
+
+# ----------------------------------------------------------------------
+#   Infill Criteria
+# ----------------------------------------------------------------------
+
+def expected_improvement(mu, sigma, best):
+    z = (best - mu) / sigma
+    return (best - mu) * scipy.stats.norm.cdf(z) + sigma * scipy.stats.norm.pdf(z)
+
+
+def probability_of_feasibility(models, U):
+    # constraints follow the scipy convention, g(x) >= 0 is feasible
+    probability = np.ones(len(U))
+    for model in models:
+        mu, sigma = model.predict(U)
+        probability *= scipy.stats.norm.cdf(mu / sigma)
+
+    return probability
+
+
+def select_infill(objective_model, constraint_models, U, f, g, batch_size, number_of_candidates, rng):
+    feasible = np.all(g >= 0., axis=1)
+
+    # candidates: uniform over the box plus a cloud around the current best point
+    best_index = np.argmin(np.where(feasible, f, np.inf)) if np.any(feasible) else np.argmax(np.min(g, axis=1))
+    candidates = np.vstack([rng.random((number_of_candidates, U.shape[1])),
+                            np.clip(U[best_index] + 0.05 * rng.standard_normal((number_of_candidates, U.shape[1])),
+                                    0., 1.)])
+
+    # kriging believer: pretend each chosen point returned its prediction, then choose the next one
+    U_believed, f_believed, g_believed = U.copy(), f.copy(), g.copy()
+    chosen = []
+    for _ in range(batch_size):
+        pof = probability_of_feasibility(constraint_models, candidates)
+        if np.any(feasible):
+            mu, sigma   = objective_model.predict(candidates)
+            acquisition = expected_improvement(mu, sigma, np.min(f_believed[feasible])) * pof
+        else:
+            acquisition = pof  # nothing feasible yet: look for the feasible region first
+
+        # never re-sample a point we already have
+        distance = np.min(np.linalg.norm(candidates[:, None, :] - U_believed[None, :, :], axis=-1), axis=1)
+        acquisition[distance < 1e-6] = -np.inf
+
+        index = int(np.argmax(acquisition))
+        u     = candidates[index]
+        chosen.append(u)
+
+        U_believed = np.vstack([U_believed, u])
+        f_believed = np.append(f_believed, objective_model.predict(u[None, :])[0])
+        g_believed = np.vstack([g_believed, [model.predict(u[None, :])[0][0] for model in constraint_models]])
+        feasible   = np.append(feasible, np.all(g_believed[-1] >= 0.))
+
+        objective_model.fit(U_believed, f_believed, optimize=False)
+        for ii, model in enumerate(constraint_models):
+            model.fit(U_believed, g_believed[:, ii], optimize=False)
+
+    return np.array(chosen)
+
+
+# ----------------------------------------------------------------------
+#   Driver
+# ----------------------------------------------------------------------
+
+def true_evaluations(pool, problem, X):
+    settings = Parallel.worker_settings(problem)
+    outputs  = pool.map(Parallel.evaluate_point, [(x, settings) for x in X])
+
+    Parallel.merge_outputs(problem, outputs)
+
+    f, g = [], []
+    for _, _, objective, equality, inequality, _ in outputs:
+        f.append(objective[0])
+        # equality constraints h(x) = 0 become tolerance - |h| >= 0
+        g.append(np.concatenate([inequality, 1e-4 - np.abs(equality)]))
+
+    return np.array(f), np.array(g)
+
+
+def Surrogate_Solve(problem, setup, max_evaluations=60, initial_points=None, batch_size=4, processes=None,
+                    number_of_candidates=2000, seed=None):
+    inputs = problem.optimization_problem.inputs
+    d      = len(inputs)
+    rng    = np.random.default_rng(seed)
+
+    if initial_points is None:
+        initial_points = 2 * d + 1
+
+    pool = Parallel.worker_pool(setup, processes)
+
+    try:
+        U    = Sampling.latin_hypercube(initial_points, d, seed)
+        f, g = true_evaluations(pool, problem, Sampling.to_scaled_inputs(U, inputs))
+
+        while len(U) < max_evaluations:
+            objective_model   = Gaussian_Process().fit(U, f)
+            constraint_models = [Gaussian_Process().fit(U, g[:, ii]) for ii in range(g.shape[1])]
+
+            batch        = min(batch_size, max_evaluations - len(U))
+            U_new        = select_infill(objective_model, constraint_models, U, f, g, batch, number_of_candidates, rng)
+            f_new, g_new = true_evaluations(pool, problem, Sampling.to_scaled_inputs(U_new, inputs))
+
+            U = np.vstack([U, U_new])
+            f = np.append(f, f_new)
+            g = np.vstack([g, g_new])
+
+            print("Surrogate optimization: ", len(U), "true evaluations, best feasible objective ",
+                  np.min(np.where(np.all(g >= 0., axis=1), f, np.inf)))
+    finally:
+        pool.close()
+        pool.join()
+
+    feasible = np.all(g >= 0., axis=1)
+    index    = np.argmin(np.where(feasible, f, np.inf)) if np.any(feasible) else np.argmax(np.min(g, axis=1))
+
+    outputs = Data()
+    outputs.x                   = Sampling.to_scaled_inputs(U[index], inputs)
+    outputs.objective           = f[index]
+    outputs.constraints         = g[index]
+    outputs.feasible            = bool(feasible[index])
+    outputs.evaluations         = len(U)
+    outputs.history             = Data()
+    outputs.history.x           = Sampling.to_scaled_inputs(U, inputs)
+    outputs.history.objective   = f
+    outputs.history.constraints = g
+
+    return outputs
@@ -0,0 +1,123 @@
+# Sweep.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import json
+import os
+
+import numpy as np
+from SUAVE.Core import Data
+
+import Parallel
+
+
+# ----------------------------------------------------------------------
+#   Worker Side
+# ----------------------------------------------------------------------
+
+def evaluate_sweep_point(task):
+    i, j, x, settings = task
+    nexus = Parallel.worker_nexus(settings)
+
+    try:
+        objective   = np.atleast_1d(nexus.objective(x))[0]
+        constraints = np.atleast_1d(nexus.all_constraints(x)).tolist()
+        status      = 'ok'
+    except Exception:
+        objective   = np.nan
+        constraints = [np.nan] * len(nexus.optimization_problem.constraints)
+        status      = 'failed'
+
+    return i, j, float(objective), constraints, status
+
+
+# ----------------------------------------------------------------------
+#   Results File
+# ----------------------------------------------------------------------
+
+def read_sweep_results(filename, inputs_0, inputs_1):
+    # one json record per finished grid point; a record only counts if it sits on the current grid.
+    # a later record of the same point (a retried failure) replaces the earlier one
+    done = {}
+    if not os.path.exists(filename):
+        return done
+
+    with open(filename) as results_file:
+        for line in results_file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # partially written last line of a crashed sweep
+
+            i, j = record['i'], record['j']
+            if i < len(inputs_0) and j < len(inputs_1) \
+                    and np.isclose(record['x0'], inputs_0[i]) and np.isclose(record['x1'], inputs_1[j]):
+                done[(i, j)] = record
+
+    return done
+
+
+# ----------------------------------------------------------------------
+#   Parallel, Resumable Carpet Plot
+# ----------------------------------------------------------------------
+
+def carpet_sweep(problem, setup, number_of_points, filename, sweep_index_0=0, sweep_index_1=1, processes=None):
+    opt_prob = problem.optimization_problem
+    inputs   = opt_prob.inputs
+    scale    = np.array(inputs[:, 4], dtype=float)
+    base_x   = np.array(inputs[:, 1], dtype=float) / scale
+
+    # sweep the two selected inputs between their bounds (unscaled values)
+    inputs_0 = np.linspace(inputs[sweep_index_0, 2], inputs[sweep_index_0, 3], number_of_points)
+    inputs_1 = np.linspace(inputs[sweep_index_1, 2], inputs[sweep_index_1, 3], number_of_points)
+
+    done     = read_sweep_results(filename, inputs_0, inputs_1)
+    settings = Parallel.worker_settings(problem)
+    tasks    = []
+    for i in range(number_of_points):
+        for j in range(number_of_points):
+            if done.get((i, j), {}).get('status') == 'ok':  # failed points are retried on a restart
+                continue
+            x = base_x.copy()
+            x[sweep_index_0] = inputs_0[i] / scale[sweep_index_0]
+            x[sweep_index_1] = inputs_1[j] / scale[sweep_index_1]
+            tasks.append((i, j, x, settings))
+
+    print("Carpet sweep: ", number_of_points ** 2 - len(tasks), "points loaded from", filename, ",", len(tasks), "to evaluate")
+
+    if tasks:
+        pool = Parallel.worker_pool(setup, processes)
+        try:
+            with open(filename, 'a') as results_file:
+                for i, j, objective, constraints, status in pool.imap_unordered(evaluate_sweep_point, tasks):
+                    record = dict(i=i, j=j, x0=float(inputs_0[i]), x1=float(inputs_1[j]),
+                                  objective=objective, constraints=constraints, status=status)
+                    # stream every finished point so a crashed sweep keeps its work
+                    results_file.write(json.dumps(record) + '\n')
+                    results_file.flush()
+                    done[(i, j)] = record
+        finally:
+            pool.close()
+            pool.join()
+
+    # pack in the same layout carpet_plot returns
+    obj_scaling    = opt_prob.objective[0][1]
+    constraint_num = len(opt_prob.constraints)
+    objective      = np.zeros((number_of_points, number_of_points))
+    constraint_val = np.zeros((constraint_num, number_of_points, number_of_points))
+
+    for (i, j), record in done.items():
+        objective[j, i]         = record['objective'] * obj_scaling
+        constraint_val[:, j, i] = record['constraints']
+
+    outputs = Data()
+    outputs.inputs         = np.array([inputs_0, inputs_1])
+    outputs.objective      = objective
+    outputs.constraint_val = constraint_val
+
+    return outputs
@@ -0,0 +1,114 @@
+# Telemetry.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import json
+import sys
+import time
+
+import numpy as np
+
+from Process_Local import Process_Local
+
+# verbosity levels, a value is kept when its level is <= the configured verbosity
+QUIET   = 0
+SUMMARY = 1   # the numbers post_process used to print every evaluation
+DETAIL  = 2   # engine geometry and other per-evaluation diagnostics
+
+
+# ----------------------------------------------------------------------
+#   Buffered Per-Evaluation Records
+# ----------------------------------------------------------------------
+
+def to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist() if value.size > 1 else to_json(value.reshape(-1)[0]) if value.size else []
+    if isinstance(value, (np.integer, np.floating, np.bool_)):
+        return value.item()
+    if isinstance(value, dict):
+        return dict((str(key), to_json(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+
+    return value
+
+
+class Telemetry_Log(Process_Local):
+
+    def __init__(self, filename='telemetry_{pid}.jsonl', verbosity=SUMMARY, flush_every=200, echo=False):
+        self.filename    = filename      # {pid} is filled in at flush time, so every worker writes its own file
+        self.verbosity   = verbosity
+        self.flush_every = flush_every   # records held in memory between writes
+        self.echo        = echo          # also print each flushed batch, for interactive runs
+        self.evaluations = 0
+        self._check_process()
+
+    def _reset(self):
+        # records buffered in the parent are written by the parent
+        self._buffer = []
+        self._record = None
+
+    def begin(self, **context):
+        self._check_process()
+        self.evaluations += 1
+        self._record = dict(evaluation=self.evaluations, pid=self._pid, time=time.time(), **to_json(context))
+
+        return self._record
+
+    def add(self, source, level=SUMMARY, **values):
+        if level > self.verbosity:
+            return
+        self._check_process()
+        if self._record is None:
+            self.begin()
+        self._record.setdefault(source, {}).update(to_json(values))
+
+    def end(self):
+        if self._record is not None and self.verbosity > QUIET:
+            self._buffer.append(self._record)
+        self._record = None
+
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        self._check_process()
+        if self._record is not None:
+            self.end()
+        if not self._buffer:
+            return
+
+        lines = [json.dumps(record) for record in self._buffer]
+        with open(self.filename.format(pid=self._pid), 'a') as telemetry_file:
+            telemetry_file.write('\n'.join(lines) + '\n')
+        if self.echo:
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
+        self._buffer = []
+
+
+# one log per process, configured by the driver script
+telemetry = Telemetry_Log()
+
+
+def configure(filename=None, verbosity=None, flush_every=None, echo=None):
+    telemetry.flush()
+    if filename is not None:
+        telemetry.filename = filename
+    if verbosity is not None:
+        telemetry.verbosity = verbosity
+    if flush_every is not None:
+        telemetry.flush_every = flush_every
+    if echo is not None:
+        telemetry.echo = echo
+
+    return telemetry
+
+
+def record(source, level=SUMMARY, **values):
+    telemetry.add(source, level, **values)
@@ -11,6 +11,7 @@ import SUAVE
 import numpy as np
 from SUAVE.Core import Units
 
+from Configs import Overlay_Config
 from engine import engine_caluclations
 from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_planform, horizontal_tail_planform_raymer, \
     vertical_tail_planform_raymer, fuselage_planform
@@ -288,7 +289,8 @@ def configs_setup(vehicle):
 
     configs = SUAVE.Components.Configs.Config.Container()
 
-    base_config = SUAVE.Components.Configs.Config(vehicle)
+    # configs share every component with the base and only copy what they override
+    base_config = Overlay_Config(vehicle)
     base_config.tag = 'base'
     configs.append(base_config)
 
@@ -296,7 +298,7 @@ def configs_setup(vehicle):
     #   Cruise Configuration
     # ------------------------------------------------------------------
 
-    config = SUAVE.Components.Configs.Config(base_config)
+    config = Overlay_Config(base_config)
     config.tag = 'cruise'
 
     # config.maximum_lift_coefficient = 1.4
@@ -307,10 +309,10 @@ def configs_setup(vehicle):
     #   Takeoff Configuration
     # ------------------------------------------------------------------
 
-    config = SUAVE.Components.Configs.Config(base_config)
+    config = Overlay_Config(base_config)
     config.tag = 'takeoff'
 
-    config.wings['main_wing'].control_surfaces.flap.angle = 20. * Units.deg
+    config.override('wings.main_wing.control_surfaces.flap.angle', 20. * Units.deg)
 
     # config.landing_gear.gear_condition = 'up' # Currently no landing gear on
 
@@ -320,10 +322,10 @@ def configs_setup(vehicle):
     #   Landing Configuration
     # ------------------------------------------------------------------
 
-    config = SUAVE.Components.Configs.Config(base_config)
+    config = Overlay_Config(base_config)
     config.tag = 'landing'
 
-    config.wings['main_wing'].control_surfaces.flap.angle = 30. * Units.deg
+    config.override('wings.main_wing.control_surfaces.flap.angle', 30. * Units.deg)
 
     # config.landing_gear.gear_condition = 'down'
 
@@ -0,0 +1,114 @@
+# Warm_Start.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+#   Resample Unknowns to Another Number of Control Points
+# ----------------------------------------------------------------------
+
+def chebyshev_points(number_of_points):
+    # normalized positions of SUAVE's default (chebyshev) segment discretization
+    return 0.5 * (1. - np.cos(np.pi * np.arange(number_of_points) / max(number_of_points - 1, 1)))
+
+
+def resample_unknowns(unknowns, number_of_points):
+    resampled = deepcopy(unknowns)
+    for key, value in unknowns.items():
+        value = np.atleast_2d(np.array(value, dtype=float))
+        if value.shape[0] == number_of_points:
+            continue
+        if value.shape[0] == 1:
+            resampled[key] = np.ones((number_of_points, 1)) * value
+            continue
+
+        old_points = chebyshev_points(value.shape[0])
+        new_points = chebyshev_points(number_of_points)
+        resampled[key] = np.array([np.interp(new_points, old_points, column) for column in value.T]).T
+
+    return resampled
+
+
+def converged_unknowns(results):
+    unknowns = {}
+    for tag, segment in results.segments.items():
+        state = segment.state if 'state' in segment else segment
+        if 'unknowns' in state:
+            unknowns[tag] = deepcopy(state.unknowns)
+
+    return unknowns
+
+
+# ----------------------------------------------------------------------
+#   Converged Segment Unknowns of Recent Design Points
+# ----------------------------------------------------------------------
+
+class Mission_Warm_Start(object):
+
+    def __init__(self, size=16, max_distance=None):
+        self.size         = size
+        self.max_distance = max_distance  # in scaled inputs, None -> always use the nearest point
+        self.hits         = 0
+        self.misses       = 0
+        self.seed         = None          # unknowns every solve starts from instead, e.g. a gradient's base point
+        self._points      = []            # [ (x, { segment tag : unknowns }) ]
+
+    def store(self, x, results):
+        unknowns = converged_unknowns(results)
+
+        self._points.append((np.array(x, dtype=float), unknowns))
+        if len(self._points) > self.size:
+            self._points.pop(0)
+
+    def nearest(self, x):
+        if not self._points:
+            return None
+
+        x         = np.array(x, dtype=float)
+        distances = [np.linalg.norm(x - point) for point, _ in self._points]
+        index     = int(np.argmin(distances))
+
+        if self.max_distance is not None and distances[index] > self.max_distance:
+            return None
+
+        return self._points[index][1]
+
+    def converged_at(self, x):
+        # unknowns stored for exactly this design point, None if it was not solved recently
+        x = np.array(x, dtype=float)
+        for point, unknowns in reversed(self._points):
+            if np.array_equal(point, x):
+                return unknowns
+
+        return None
+
+    def apply(self, x, mission):
+        # seed every segment solver with the unknowns converged at the nearest stored design point
+        unknowns = self.seed if self.seed is not None else self.nearest(x)
+        if unknowns is None:
+            self.misses += 1
+            return False
+
+        applied = False
+        for tag, segment in mission.segments.items():
+            if tag not in unknowns:
+                continue
+            number_of_points = segment.state.numerics.number_control_points
+            segment.state.unknowns = resample_unknowns(unknowns[tag], number_of_points)
+            applied = True
+
+        if applied:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        return applied
@@ -0,0 +1,76 @@
+# Weight_Cache.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from Cache import LRU_Cache, fingerprint
+from Incremental import set_path_value
+
+# breakdowns by weight fingerprint, shared between configs and optimizer iterations
+weight_cache = LRU_Cache(size=64)
+
+# keys the correlations do not read (flap settings) or that the weight evaluation itself writes
+weight_outputs = ['control_surfaces', 'weight_breakdown', 'breakdown', 'operating_empty', 'mass',
+                  'center_of_gravity', 'zero_fuel_center_of_gravity', 'moments_of_inertia']
+
+# turbofan component states: rewritten by every mission evaluation (they would change the key after each one),
+# never read by the correlations, and by far the largest arrays in the vehicle
+mission_state = ['inputs', 'outputs']
+
+
+# ----------------------------------------------------------------------
+#   Fingerprint and Component Masses
+# ----------------------------------------------------------------------
+
+def weight_fingerprint(vehicle):
+    # the config tag ('cruise', 'takeoff', ...) must not split otherwise identical vehicles
+    return fingerprint(vehicle, exclude=weight_outputs + mission_state + ['tag'])
+
+
+def component_masses(data, path='', masses=None, active=None):
+    # { 'wings.main_wing.mass_properties.mass' : value, ... } as written by the weights correlations
+    masses = {} if masses is None else masses
+    active = set() if active is None else active
+    if id(data) in active:
+        return masses
+    active.add(id(data))
+
+    for key, value in data.items():
+        if str(key).startswith('_') or not isinstance(value, dict):
+            continue
+        if key == 'mass_properties' and 'mass' in value:
+            masses[path + 'mass_properties.mass'] = value['mass']
+        elif key not in weight_outputs:
+            component_masses(value, path + key + '.', masses, active)
+
+    active.discard(id(data))
+
+    return masses
+
+
+# ----------------------------------------------------------------------
+#   Cached Weights Evaluation
+# ----------------------------------------------------------------------
+
+def evaluate_weights(weights):
+    vehicle = weights.vehicle
+    key     = weight_fingerprint(vehicle)
+    entry   = weight_cache.get(key)
+
+    if entry is None:
+        results = weights.evaluate()
+        weight_cache.put(key, (results, component_masses(vehicle)))
+        return results
+
+    # same side effects as Weights_Transport.evaluate, without re-running the correlations
+    results, masses = entry
+    for path, mass in masses.items():
+        set_path_value(vehicle, path, mass)
+    vehicle.weight_breakdown = results
+    vehicle.mass_properties.operating_empty = results.empty
+
+    return results
@@ -1,16 +1,96 @@
 import SUAVE
+from copy import deepcopy
 # import Turbine_saga
 from SUAVE.Methods.Propulsion.turbofan_sizing import turbofan_sizing
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Propulsion import compute_turbofan_geometry
 
+from Cache import LRU_Cache, fingerprint
+# Engine_Deck (scipy.interpolate) is imported when use_engine_deck is set
+
+# evaluate the mission from a thrust/fuel-flow deck tabulated right after sizing instead of the full cycle
+use_engine_deck = False
+
+# sized turbofans by cycle/sizing inputs, shared between configs and reused across optimizer iterations
+sized_engines = LRU_Cache(size=32)
+
+# component settings the sizing depends on (outputs written by the sizing are deliberately left out)
+cycle_settings = ['polytropic_efficiency', 'pressure_ratio', 'mechanical_efficiency', 'efficiency', 'alphac',
+                  'turbine_inlet_temperature']
+
+
+def sizing_key(turbofan, mach_number, altitude):
+    settings = [turbofan.thrust.total_design, turbofan.bypass_ratio, turbofan.number_of_engines,
+                mach_number, altitude]
+
+    for tag, component in sorted(turbofan.items(), key=lambda kv: str(kv[0])):
+        if not isinstance(component, dict):
+            continue
+        for name in cycle_settings:
+            if name in component:
+                settings.append([tag, name, component[name]])
+
+    return fingerprint(settings)
+
+
+def size_turbofan(turbofan, mach_number, altitude, conditions=None, private=False):
+    # one sizing per unique (design thrust, bypass, mach, altitude, component settings).
+    # private: the caller's engine is a copy nobody else holds, so it is sized in place
+    key = sizing_key(turbofan, mach_number, altitude)
+    sized = sized_engines.get(key)
+
+    # a shared engine may have been written to through an alias since it was stored
+    if sized is not None and sizing_key(sized, mach_number, altitude) == key:
+        return sized
+
+    sized = turbofan if private else deepcopy(turbofan)
+    turbofan_sizing(sized, mach_number, altitude)
+    compute_turbofan_geometry(sized, conditions)  # engine_length, nacelle_diameter, Swet
+    if use_engine_deck:
+        from Engine_Deck import tabulated_turbofan
+        sized = tabulated_turbofan(sized, key)
+    sized_engines.put(key, sized)
+
+    return sized
+
+
+
+# unsized component graphs, built once per builder and copied for every new engine
+engine_prototypes = {}
+
+
+def engine_prototype(builder=None):
+    builder = builder or build_turbofan
+    if builder not in engine_prototypes:
+        engine_prototypes[builder] = builder()
+
+    return engine_prototypes[builder]
+
+
+def turbofan_variant(bypass, num_engine, thrust_total, builder=None):
+    # parameterized copy of the prototype, still unsized
+    gt_engine                                   = deepcopy(engine_prototype(builder))
+    gt_engine.number_of_engines                 = num_engine
+    gt_engine.bypass_ratio                      = bypass
+    gt_engine.thrust.total_design               = thrust_total
+
+    return gt_engine
+
 
 def engine_caluclations(altitude, bypass, mach_number, num_engine, thrust_total):
+    gt_engine = turbofan_variant(bypass, num_engine, thrust_total)
+
+    # size the turbofan, engines with the same cycle parameters are only sized once
+    sized = size_turbofan(gt_engine, mach_number, altitude, private=True)
+
+    # callers own (and modify) the engine they get back, the cached one stays untouched
+    return deepcopy(sized)
+
+
+def build_turbofan():
     # initialize the gas turbine network
 
     gt_engine                                   = SUAVE.Components.Energy.Networks.Turbofan()
     gt_engine.tag                               = 'turbofan'
-    gt_engine.number_of_engines                 = num_engine
-    gt_engine.bypass_ratio                      = bypass
     # gt_engine.engine_length = 5.2
     gt_engine.nacelle_diameter                  = 2   # Guess
 
@@ -108,16 +188,12 @@ def engine_caluclations(altitude, bypass, mach_number, num_engine, thrust_total)
     thrust                                      = SUAVE.Components.Energy.Processes.Thrust()
 
     thrust.tag                                  = 'compute_thrust'
-    # total design thrust (includes all the engines)
-    thrust.total_design                         = thrust_total  # should be just a pointer not a number
+    # total design thrust (includes all the engines), set per variant
+    thrust.total_design                         = 0.
     # add thrust to the network
     gt_engine.thrust                            = thrust
     # gt_engine.OPR = OPR
     # print thrust
-    # size the turbofan
-    turbofan_sizing(gt_engine, mach_number, altitude)
-
-    compute_turbofan_geometry(gt_engine, None)
 
     return gt_engine
 